@@ -12,20 +12,28 @@ from urllib.parse import urlparse
 
 from flask import request
 from flask_misaka import Misaka
-from jinja2 import ChainableUndefined
+from jinja2 import ChainableUndefined, FileSystemBytecodeCache
 from survey_assist_utils.api_token.jwt_utils import check_and_refresh_token
 from survey_assist_utils.logging import get_logger
 
 from survey_assist_ui.routes import register_blueprints
 from utils.access_utils import update_tokens_on_api_clients
-from utils.api_utils import APIClient, get_verification_api_id_token
+from utils.api_utils import (
+    APIClient,
+    OTPVerificationService,
+    get_verification_api_id_token,
+)
 from utils.app_types import SurveyAssistFlask
-from utils.app_utils import load_survey_definition
+from utils.app_utils import freeze, load_survey_definition
+from utils.cache_utils import ResponseCache
 
 from .versioning import get_app_version
 
 logger = get_logger(__name__, level="INFO")
 
+# Navigation variables shared by every template, built once at import
+NAVIGATION_CONTEXT = freeze({"navigation": {"navigation": {}}})
+
 
 def create_app(test_config: dict | None = None) -> SurveyAssistFlask:
     """Initialises and configures the Survey Assist Flask application.
@@ -62,6 +70,16 @@ def create_app(test_config: dict | None = None) -> SurveyAssistFlask:
     flask_app.jinja_env.add_extension("jinja2.ext.do")
     flask_app.jinja_env.trim_blocks = True
     flask_app.jinja_env.lstrip_blocks = True
+    # Cache compiled template bytecode on disk, keyed on the template source, so
+    # workers on the same instance skip recompiling. JINJA_CACHE_DIR selects the
+    # directory; the default per-user temp directory is local to each instance
+    # (in-memory on Cloud Run) and does not survive a new instance.
+    jinja_cache_dir = os.getenv("JINJA_CACHE_DIR")
+    if jinja_cache_dir:
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+    flask_app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+        directory=jinja_cache_dir
+    )
     flask_app.config["FREEZER_IGNORE_404_NOT_FOUND"] = True
     flask_app.config["FREEZER_DEFAULT_MIMETYPE"] = "text/html"
     flask_app.config["FREEZER_DESTINATION"] = "../build"
@@ -91,6 +109,9 @@ def create_app(test_config: dict | None = None) -> SurveyAssistFlask:
         redirect_on_error=False,
     )
 
+    # Successful SIC lookups are shared between participants for up to an hour
+    flask_app.sic_lookup_cache = ResponseCache(maxsize=4096, ttl=3600)
+
     # Initialise API client for Verify Service
     flask_app.verify_api_client = APIClient(
         base_url=f"{flask_app.verify_api_base}",
@@ -98,6 +119,8 @@ def create_app(test_config: dict | None = None) -> SurveyAssistFlask:
         logger_handle=logger,
         redirect_on_error=False,
     )
+    # The service only wraps the client, so one instance serves every request
+    flask_app.otp_service = OTPVerificationService(flask_app.verify_api_client)
 
     # Allow test overrides
     if test_config:
@@ -115,10 +138,9 @@ def create_app(test_config: dict | None = None) -> SurveyAssistFlask:
         to define them in each route.
 
         Returns:
-            dict: A dictionary containing the `navigation` object.
+            Mapping: A read-only mapping containing the `navigation` object.
         """
-        navigation = {"navigation": {}}
-        return {"navigation": navigation}
+        return NAVIGATION_CONTEXT
 
     # Check the JWT token status before processing the request
     @flask_app.before_request
@@ -3,6 +3,7 @@
 Verifies that the user has a valid code for access to the survey.
 """
 
+import logging
 from typing import cast
 
 from flask import Blueprint, current_app, redirect, render_template, request, session
@@ -48,13 +49,16 @@ def check_access():
     participant_id = request.form.get("participant-id").upper()
     access_code = format_access_code(request.form.get("access-code"))
 
-    logger.debug(f"participant_id:{participant_id} access code:{mask_otp(access_code)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "participant_id:%s access code:%s", participant_id, mask_otp(access_code)
+        )
     valid, error = validate_access(participant_id, access_code)
     if valid:
         session["participant_id"] = participant_id
         session["access_code"] = mask_otp(access_code)
         session.modified = True
-        logger.info(f"participant_id:{participant_id} survey accessed")
+        logger.info("participant_id:%s survey accessed", participant_id)
         return redirect("/")
     else:
         return render_template(
@@ -21,6 +21,7 @@ from survey_assist_utils.logging import get_logger
 
 from utils.access_utils import require_access
 from utils.app_types import ResponseType, SurveyAssistFlask
+from utils.app_utils import number_to_word
 from utils.feedback_utils import (
     FeedbackQuestion,
     copy_feedback_from_survey_iteration,
@@ -38,7 +39,6 @@ from utils.session_utils import (
     remove_model_from_session,
     session_debug,
 )
-from utils.survey_utils import number_to_word
 
 feedback_blueprint = Blueprint("feedback", __name__)
 feedback_blueprint.before_request(require_access)
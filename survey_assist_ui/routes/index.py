@@ -5,7 +5,7 @@ This is the home page for the Survey Assist UI
 
 from typing import cast
 
-from flask import Blueprint, current_app, redirect, render_template, session
+from flask import Blueprint, current_app, render_template, session
 from flask.typing import ResponseReturnValue
 from survey_assist_utils.logging import get_logger
 
@@ -38,9 +38,6 @@ def index() -> ResponseReturnValue:
     """
     app = cast(SurveyAssistFlask, current_app)
 
-    if "participant_id" not in session and "access_code" not in session:
-        return redirect("/access")
-
     # Reset the current question index in the session
     # This should ensure that if a user returns to the index page
     # any in-progress survey is reset
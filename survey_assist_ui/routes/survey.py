@@ -3,9 +3,9 @@
 This is the generic question page for the Survey Assist UI
 """
 
-import re
+import logging
 from datetime import datetime, timezone
-from typing import Callable, cast
+from typing import cast
 
 from flask import (
     Blueprint,
@@ -14,14 +14,11 @@ from flask import (
     render_template,
     request,
     session,
+    stream_template,
     url_for,
 )
 from survey_assist_utils.logging import get_logger
 
-from models.result import (
-    GenericResponse,
-    GenericSurveyAssistResult,
-)
 from utils.access_utils import require_access
 from utils.app_types import ResponseType, SurveyAssistFlask
 from utils.map_results_utils import translate_session_to_model
@@ -30,9 +27,9 @@ from utils.session_utils import (
     add_follow_up_response_to_classify,
     clean_text,
     get_person_id,
+    init_survey_result,
     log_route,
     remove_access_from_session,
-    save_model_to_session,
     session_debug,
 )
 from utils.survey_assist_utils import result_sic_only
@@ -41,7 +38,7 @@ from utils.survey_utils import (
     followup_redirect,
     get_question_routing,
     init_survey_iteration,
-    number_to_word,
+    resolve_question_placeholder,
     update_session_and_redirect,
 )
 
@@ -51,6 +48,16 @@ survey_blueprint.before_request(require_access)
 
 logger = get_logger(__name__, level="INFO")
 
+# Question names handled by Survey Assist rather than the core survey routing
+NON_CORE_QUESTIONS = frozenset(
+    (
+        "survey_assist_consent",
+        "follow_up_question",
+        "survey_assist_followup_1",
+        "survey_assist_followup_2",
+    )
+)
+
 
 @survey_blueprint.route("/intro", methods=["GET"])
 @log_route()
@@ -71,14 +78,12 @@ def survey() -> str:
         str: Rendered HTML for the current survey question.
     """
     app = cast(SurveyAssistFlask, current_app)
-    survey_title = app.survey_title
-    wave_id = app.wave_id
     questions = app.questions
 
-    # Initialise the current question index in the session if it doesn't exist
+    # Initialise the current question index in the session if it doesn't exist.
+    # Assigning a session key marks the session as modified.
     if "current_question_index" not in session:
         session["current_question_index"] = FIRST_QUESTION
-        session.modified = True
 
     # If this is the first question, initialise the iteration data
     # and set the time_start
@@ -86,65 +91,24 @@ def survey() -> str:
         # Initialise the survey iteration data in the session
         session["survey_iteration"] = init_survey_iteration()
 
-        if "response" in session:
-            # Initialise the response data in the session
-            session["response"] = {}
+        # Start with no saved responses
+        session["response"] = {}
 
         # Set the time start based on the current timestamp
-        session["survey_iteration"]["time_start"] = datetime.now(timezone.utc)
-
-        # Initialise the results model in the session
-        # case_id is a unique identifier that identifies a household
-        # that received the survey.
-        # user is the main user that starts the survey.
-        result_model = GenericSurveyAssistResult(
-            survey_id=re.sub(r"\s+", "_", survey_title.strip().lower()),
-            wave_id=wave_id,
-            case_id=session["participant_id"],
-            user=get_person_id(),
-            time_start=session["survey_iteration"]["time_start"],
-            time_end=session["survey_iteration"]["time_start"],  # will be updated later
-            responses=[],
-        )
-
-        # person-id is an indiviual respondent in the household
-        new_response = GenericResponse(
-            person_id=get_person_id(),
-            time_start=session["survey_iteration"]["time_start"],
-            time_end=session["survey_iteration"]["time_start"],  # will be updated later
-            survey_assist_interactions=[],
-        )
-        # Despite responses being a list pylint can't figure it out
-        # so we have to disable the linter warning
-        responses: list[GenericResponse] = result_model.responses
-        responses.append(new_response)  # pylint: disable=no-member
+        now = datetime.now(timezone.utc)
+        session["survey_iteration"]["time_start"] = now
 
-        save_model_to_session("survey_result", result_model)
+        # Initialise the results model in the session. Results are sent for
+        # every respondent, not only those who consent to Survey Assist.
+        init_survey_result(now)
         session.modified = True
 
     # Get the current question based on the index
     current_index = session["current_question_index"]
     current_question = questions[current_index]
 
-    # if question_text contains PLACEHOLDER_TEXT, get the associated
-    # placeholder_field associated with the question and replace the
-    # PLACEHOLDER_TEXT string with the value of the specified field
-    # held in session response
-    if "PLACEHOLDER_TEXT" in current_question["question_text"]:
-        # Copy the current question to a new dictionary
-        current_question = current_question.copy()
-
-        placeholder_field = current_question["placeholder_field"]
-
-        replacement_text = session["response"].get(placeholder_field)
-        replacement_text = clean_text(
-            replacement_text, "placeholder_text", get_person_id()
-        )
-
-        if placeholder_field is not None:
-            current_question["question_text"] = current_question[
-                "question_text"
-            ].replace("PLACEHOLDER_TEXT", replacement_text)
+    # Resolve PLACEHOLDER_TEXT from the earlier response the question refers to
+    current_question = resolve_question_placeholder(current_question)
 
     limit = (
         current_question.get("char_limit", 150)
@@ -173,81 +137,73 @@ def save_response() -> ResponseType | str | tuple[str, int]:
     questions = app.questions
     survey_assist = app.survey_assist
 
+    form = request.form
+    question = form.get("question_name")
+    if question is None:
+        logger.warning(
+            "person_id:%s missing form field: 'question_name'", get_person_id()
+        )
+        return "Invalid question ID", 400
+
     # Define a dictionary to store responses
     if "response" not in session:
         session["response"] = {}
 
-    actions: dict[str, Callable[[], ResponseType | str]] = {
-        "core_question": lambda: update_session_and_redirect(
-            request, questions, survey_assist, *routing
-        ),
-        "survey_assist_consent": consent_redirect,
-        "survey_assist_followup": followup_redirect,
-    }
-
-    question = request.form.get("question_name")
-
     question_name = question  # Store original question name for logs
-    if question is None:
-        raise ValueError("Missing form field: 'question_name'")
 
     # If the question is not consent or a follow up question from Survey Assist,
     # then get the routing for the normal survey question
-    if question not in [
-        "survey_assist_consent",
-        "follow_up_question",
-        "survey_assist_followup_1",
-        "survey_assist_followup_2",
-    ]:
-        routing = get_question_routing(question, questions)
+    if question not in NON_CORE_QUESTIONS:
+        routing = get_question_routing(question, questions, app.question_routing)
         logger.debug(
-            f"person_id:{get_person_id()} question: {question} ans: {request.form.get(routing[0])}"
+            "person_id:%s question: %s ans: %s",
+            get_person_id(),
+            question,
+            form.get(routing[0]),
         )
         question = "core_question"
 
     # If the question is a follow up question from Survey Assist, then add
     # the user's response to the question to the session data
     if question.startswith("survey_assist_followup"):
-        # get survey data
-        survey_data = session.get("survey_iteration")
-        if survey_data is None:
-            raise ValueError("survey_data is None, cannot extract questions")
-
-        # get questions
-        survey_questions = survey_data["questions"]
-
-        # get the last question and store the answer against it
-        last_question = survey_questions[-1]
-        last_question["response"] = request.form.get(last_question["response_name"])
-
-        response_type = last_question.get("response_type", "none")
+        # Get the last question in the survey iteration and store the answer
+        # against it. A missing survey_iteration raises KeyError.
+        survey_data = session["survey_iteration"]
+        last_question = survey_data["questions"][-1]
+        response_name = last_question["response_name"]
 
         user_id = get_person_id()
-        if response_type in ("textarea", "text"):
-            last_question["response"] = clean_text(
-                last_question["response"], last_question["response_name"], user_id
-            )
+        user_response = form.get(response_name)
+        if last_question.get("response_type", "none") in ("textarea", "text"):
+            user_response = clean_text(user_response, response_name, user_id)
+
+        last_question["response"] = user_response
+        session.modified = True
 
         add_follow_up_response_to_classify(
-            last_question["question_id"], last_question["response"], user_id
+            last_question["question_id"], user_response, user_id
         )
         # The followup questions perform the same action
         question = "survey_assist_followup"
 
     logger.info(
-        f"person_id:{get_person_id()} question: {question_name} action: {question}"
+        "person_id:%s question: %s action: %s", get_person_id(), question_name, question
     )
 
     logger.debug(
-        f"person_id:{get_person_id()} response list: {session.get('response')}"
+        "person_id:%s response list: %r", get_person_id(), session.get("response")
     )
 
-    if question in actions:
-        iteration_data = session.get("survey_iteration", {})
-        logger.debug("Survey Iteration")
-        logger.debug(iteration_data)
-        logger.debug(f"Executing action for question: {question}")
-        return actions[question]()
+    logger.debug("Survey Iteration")
+    logger.debug("%r", session.get("survey_iteration", {}))
+    logger.debug("Executing action for question: %s", question)
+
+    if question == "core_question":
+        return update_session_and_redirect(request, questions, survey_assist, *routing)
+    if question == "survey_assist_consent":
+        return consent_redirect()
+    if question == "survey_assist_followup":
+        return followup_redirect()
 
     return "Invalid question ID", 400
 
@@ -256,46 +212,22 @@ def save_response() -> ResponseType | str | tuple[str, int]:
 @session_debug
 @log_route()
 def survey_assist_consent() -> str:
-    """Renders the Survey Assist consent page, replacing placeholders as needed.
+    """Renders the Survey Assist consent page.
+
+    The consent text placeholders are resolved when the survey definition is loaded.
 
     Returns:
         str: Rendered HTML for the consent page.
     """
     app = cast(SurveyAssistFlask, current_app)
-    survey_assist = app.survey_assist
-
-    if "PLACEHOLDER_FOLLOWUP" in survey_assist["consent"]["question_text"]:
-        # Get the maximum followup
-        max_followup = survey_assist["consent"]["max_followup"]
-
-        if max_followup == 1:
-            followup_text = "one additional question"
-        else:
-            # convert numeric to string
-            number_word = number_to_word.get(max_followup, "unknown")
-
-            followup_text = f"a maximum of {number_word} additional questions"
-
-        # Replace PLACEHOLDER_FOLLOWUP with the content of the placeholder field
-        survey_assist["consent"]["question_text"] = survey_assist["consent"][
-            "question_text"
-        ].replace("PLACEHOLDER_FOLLOWUP", followup_text)
-
-    if "PLACEHOLDER_REASON" in survey_assist["consent"]["question_text"]:
-        # Replace PLACEHOLDER_REASON with the content of the placeholder field
-        survey_assist["consent"]["question_text"] = survey_assist["consent"][
-            "question_text"
-        ].replace(
-            "PLACEHOLDER_REASON",
-            survey_assist["consent"]["placeholder_reason"],
-        )
+    consent = app.survey_assist["consent"]
 
     return render_template(
         "survey_assist_consent.html",
-        title=survey_assist["consent"]["title"],
-        question_name=survey_assist["consent"]["question_name"],
-        question_text=survey_assist["consent"]["question_text"],
-        justification_text=survey_assist["consent"]["justification_text"],
+        title=consent["title"],
+        question_name=consent["question_name"],
+        question_text=consent["question_text"],
+        justification_text=consent["justification_text"],
     )
 
 
@@ -309,41 +241,54 @@ def summary():
     """Summarises the survey data entered by the user and displays it in a summary template.
 
     Returns:
-        str: Rendered HTML for the summary page.
+        Response: Streamed HTML for the summary page, or a redirect.
     """
-    survey_data = session.get("survey_iteration")
-    survey_questions = survey_data["questions"]
+    try:
+        survey_data = session["survey_iteration"]
+        survey_questions = survey_data["questions"]
+    except KeyError:
+        logger.warning(
+            "person_id:%s - no survey iteration for summary", get_person_id()
+        )
+        return redirect(url_for("main.index"))
 
     if survey_data["time_start"] is None:
-        logger.warning(f"person_id:{get_person_id()} - time_start is not set")
+        logger.warning("person_id:%s - time_start is not set", get_person_id())
 
     # Calculate the time_end based on the current timestamp
     survey_data["time_end"] = datetime.now(timezone.utc)
     session.modified = True
 
     # Log the time taken in seconds to answer the survey
-    time_taken = (survey_data["time_end"] - survey_data["time_start"]).total_seconds()
-
-    logger.debug(
-        f"Start: {survey_data['time_start']}, End: {survey_data['time_end']}, "
-        f"Duration: {time_taken} seconds"
-    )
-
-    # Loop through the questions, when a question_name starts with survey_assist
-    # uppdate the question_text to have a label added to say it was generated by
-    # Survey Assist
-    for question in survey_questions:
-        if question["response_name"].startswith("resp-survey-assist"):
-            question["question_text"] = (
-                question["question_text"]
-                + current_app.survey_assist["question_assist_label"]
-            )
+    if logger.isEnabledFor(logging.DEBUG) and survey_data["time_start"] is not None:
+        time_taken = (
+            survey_data["time_end"] - survey_data["time_start"]
+        ).total_seconds()
+        logger.debug(
+            "Start: %s, End: %s, Duration: %s seconds",
+            survey_data["time_start"],
+            survey_data["time_end"],
+            time_taken,
+        )
 
     # If survey summary is not enabled then skip showing the summary page
     if current_app.survey_summary is False:
         return redirect(url_for("survey.survey_result"))
 
-    return render_template("summary_template.html", questions=survey_questions)
+    # Label questions generated by Survey Assist in a copy used for display,
+    # so the session question text is unchanged if the summary is reloaded
+    assist_label = current_app.survey_assist["question_assist_label"]
+    summary_questions = [
+        (
+            {**question, "question_text": question["question_text"] + assist_label}
+            if question["response_name"].startswith("resp-survey-assist")
+            else question
+        )
+        for question in survey_questions
+    ]
+
+    # Stream the page so the client starts receiving it while the list renders
+    return stream_template("summary_template.html", questions=summary_questions)
 
 
 # The survey_result route handles sending the result to the
@@ -34,10 +34,6 @@ def survey_assist() -> ResponseType | str:
     Returns:
         str: Rendered HTML content of the Survey Assist Interaction.
     """
-    job_description = session.get("response", {}).get("job_description")
-    job_title = session.get("response", {}).get("job_title")
-    org_description = session.get("response", {}).get("organisation_activity")
-
     # Retrieve the survey data from the session
     survey_iteration = session.get("survey_iteration", {})
     questions = survey_iteration.get("questions", [])
@@ -68,9 +64,11 @@ def survey_assist() -> ResponseType | str:
     # survey_iteration from here on in.
     # REFACTOR: The response dictionary should be retired entirely in favour of
     # survey_iteration but this is a larger change.
+    response = session["response"]
     for key in ("job_title", "job_description", "organisation_activity"):
-        if key in session["response"] and isinstance(session["response"][key], str):
-            session["response"][key] = session["response"][key][:10]
+        value = response.get(key)
+        if isinstance(value, str):
+            response[key] = value[:10]
 
     return classify_and_handle_followup(
         job_title, job_description, org_description  # type: ignore[arg-type]
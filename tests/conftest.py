@@ -749,26 +749,11 @@ def survey_result_session_lookup_found() -> dict[str, Any]:
     }
 
 
-@pytest.fixture(name="sample_questions")
-def fixture_sample_questions() -> list[dict[str, Any]]:
-    """Provide a minimal set of question dicts with stable IDs for tests.
-
-    Returns:
-        list[dict[str, Any]]: A list of question dictionaries,
-        each with a ``question_id`` key.
-    """
-    return [
-        {"question_id": "q1", "text": "First?"},
-        {"question_id": "q2", "text": "Second?"},
-        {"question_id": "q3", "text": "Third?"},
-    ]
-
-
 @pytest.fixture(name="questions_with_missing_id")
 def fixture_questions_with_missing_id() -> list[dict[str, Any]]:
     """Provide questions including one without a ``question_id`` key.
 
-    This exercises the default value path (empty string) in the selector.
+    Questions without an id are skipped when copying feedback.
 
     Returns:
         list[dict[str, Any]]: Question dictionaries where one item
@@ -776,7 +761,7 @@ def fixture_questions_with_missing_id() -> list[dict[str, Any]]:
     """
     return [
         {"question_id": "q1", "text": "First?"},
-        {"text": "No id here"},  # will contribute '' to all_ids
+        {"text": "No id here"},
     ]
 
 
@@ -1,12 +1,12 @@
 """Tests for the format_access_code utility function."""
 
-import re
 from types import SimpleNamespace
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from utils import access_utils
 from utils.access_utils import delete_access, format_access_code, validate_access
 from utils.app_types import SurveyAssistFlask
 
@@ -61,20 +61,23 @@ class TestFormatAccessCode:
     def test_regex_used_for_whitespace_replacement(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """It should call re.sub with the correct whitespace pattern."""
+        """It should call the precompiled whitespace pattern's sub method."""
         spy_called = {}
 
-        def fake_sub(pattern: str, repl: str, text: str) -> str:
-            spy_called.update({"pattern": pattern, "repl": repl, "text": text})
-            return "MOCKED"
+        class FakePattern:  # pylint: disable=too-few-public-methods
+            """Stand-in for the compiled whitespace pattern."""
 
-        monkeypatch.setattr(re, "sub", fake_sub)
+            def sub(self, repl: str, text: str) -> str:
+                spy_called.update({"repl": repl, "text": text})
+                return "MOCKED"
+
+        assert access_utils.WHITESPACE_PATTERN.pattern == r"\s+"
+        monkeypatch.setattr(access_utils, "WHITESPACE_PATTERN", FakePattern())
         result = format_access_code("abc def")
 
         assert result == "MOCKED"
-        assert spy_called["pattern"] == r"\s+", "Should use regex pattern '\\s+'"
         assert spy_called["repl"] == "-", "Should replace with a single hyphen"
-        assert spy_called["text"] == "abc def", "Should pass stripped text to re.sub"
+        assert spy_called["text"] == "abc def", "Should pass stripped text to sub"
 
 
 @pytest.mark.utils
@@ -97,21 +100,15 @@ def test_returns_error_when_access_code_missing() -> None:
 def test_returns_true_when_service_verifies_success(client) -> None:
     """It should return (True, '') when the service reports verified=True."""
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        # Provide the dependency used by validate_access
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.verify.return_value = SimpleNamespace(verified=True, message="OK")
 
         result = validate_access(access_id="ONS123", access_code="PFR456")
 
     assert result == (True, "")
     mock_logger.warning.assert_not_called()  # type: ignore[attr-defined]
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
     svc_inst.verify.assert_called_once_with(id_str="ONS123", otp="PFR456")
 
 
@@ -119,13 +116,9 @@ def test_returns_true_when_service_verifies_success(client) -> None:
 def test_returns_invalid_credentials_when_verification_fails(client) -> None:
     """It should return a generic invalid-credentials message when verified=False."""
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.verify.return_value = SimpleNamespace(
             verified=False, message="invalid or expired code"
         )
@@ -137,9 +130,8 @@ def test_returns_invalid_credentials_when_verification_fails(client) -> None:
     args, _ = mock_logger.warning.call_args  # type: ignore[attr-defined]
     assert (
         "Validation unsuccessful for participant_id:ONS123 - invalid or expired code"
-        in args[0]
+        in args[0] % args[1:]
     )
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
     svc_inst.verify.assert_called_once_with(id_str="ONS123", otp="BADCODE")
 
 
@@ -147,13 +139,9 @@ def test_returns_invalid_credentials_when_verification_fails(client) -> None:
 def test_returns_module_error_when_service_raises_runtime_error(client) -> None:
     """It should catch RuntimeError from the service and return the module error message."""
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.verify.side_effect = RuntimeError("boom")
 
         result = validate_access(access_id="ONS123", access_code="ANYCODE")
@@ -161,8 +149,7 @@ def test_returns_module_error_when_service_raises_runtime_error(client) -> None:
     assert result == (False, "Error in validation module")
     mock_logger.warning.assert_called()  # type: ignore[attr-defined]
     args, _ = mock_logger.warning.call_args  # type: ignore[attr-defined]
-    assert "participant_id:ONS123 error validating user: boom" in args[0]
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
+    assert "participant_id:ONS123 error validating user: boom" in args[0] % args[1:]
     svc_inst.verify.assert_called_once_with(id_str="ONS123", otp="ANYCODE")
 
 
@@ -171,24 +158,19 @@ def test_delete_access_returns_true_when_service_deletes_successfully(client) ->
     """It should return (True, '') when the service reports deleted=True.
 
     Behaviour:
-        - Builds OTPVerificationService with current_app.verify_api_client.
+        - Uses the shared OTPVerificationService on current_app.
         - Calls delete(id_str=...).
         - Logs info on success.
     """
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.delete.return_value = SimpleNamespace(deleted=True, message="OK")
 
         out = delete_access(access_id="ONS123")
 
     assert out == (True, "")
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
     svc_inst.delete.assert_called_once_with(id_str="ONS123")
     mock_logger.info.assert_called()  # type: ignore[attr-defined]
     mock_logger.warning.assert_not_called()  # type: ignore[attr-defined]
@@ -204,13 +186,9 @@ def test_delete_access_returns_invalid_id_when_service_reports_failure(client) -
         - Logs a warning that includes the service message.
     """
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.delete.return_value = SimpleNamespace(
             deleted=False, message="not found or expired"
         )
@@ -218,13 +196,12 @@ def test_delete_access_returns_invalid_id_when_service_reports_failure(client) -
         out = delete_access(access_id="ONS999")
 
     assert out == (False, "Invalid id ONS999. Not deleted.")
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
     svc_inst.delete.assert_called_once_with(id_str="ONS999")
     mock_logger.warning.assert_called()  # type: ignore[attr-defined]
     args, _ = mock_logger.warning.call_args  # type: ignore[attr-defined]
     assert (
         "Deletion unsuccessful for participant_id:ONS999 - not found or expired"
-        in args[0]
+        in args[0] % args[1:]
     )
 
 
@@ -239,23 +216,18 @@ def test_delete_access_returns_module_error_when_service_raises_runtime_error(
         - Function logs a warning and returns the generic module error tuple.
     """
     app = cast(SurveyAssistFlask, client.application)
-    with app.app_context(), patch(
-        "utils.access_utils.OTPVerificationService"
-    ) as service, patch("utils.access_utils.logger") as mock_logger:
-
-        app.verify_api_client = MagicMock()
-
-        svc_inst = service.return_value
+    with app.app_context(), patch.object(app, "otp_service") as svc_inst, patch(
+        "utils.access_utils.logger"
+    ) as mock_logger:
         svc_inst.delete.side_effect = RuntimeError("boom")
 
         out = delete_access(access_id="ONS123")
 
     assert out == (False, "Error in validation module when deleting access code")
-    service.assert_called_once_with(app.verify_api_client)  # type: ignore[attr-defined]
     svc_inst.delete.assert_called_once_with(id_str="ONS123")
     mock_logger.error.assert_called()  # type: ignore[attr-defined]
     args, _ = mock_logger.error.call_args  # type: ignore[attr-defined]
-    assert "participant_id:ONS123 error deleting access: boom" in args[0]
+    assert "participant_id:ONS123 error deleting access: boom" in args[0] % args[1:]
 
 
 @pytest.mark.utils
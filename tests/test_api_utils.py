@@ -3,6 +3,8 @@
 This module contains tests for the API client, error handling, and HTTP request logic.
 """
 
+import socket
+from collections.abc import Callable
 from http import HTTPStatus
 from types import SimpleNamespace
 from typing import cast
@@ -12,11 +14,20 @@ import pytest
 import requests
 from flask import Flask, current_app, session
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError, Timeout
 
 from models.result import LookupResponse
-from utils.api_utils import APIClient, OTPVerificationService, map_to_lookup_response
+from utils.api_utils import (
+    POOL_MAXSIZE,
+    APIClient,
+    CircuitBreaker,
+    KeepAliveAdapter,
+    OTPVerificationService,
+    map_to_lookup_response,
+    mask_otp,
+)
 from utils.app_types import SurveyAssistFlask
 from utils.feedback_utils import (
     feedback_session_to_model,
@@ -52,7 +63,7 @@ def api_client(mock_api_logger):
 @pytest.mark.utils
 def test_get_request_success(api_client):
     """Tests that APIClient.get returns JSON data on successful GET request."""
-    with patch("utils.api_utils.requests.get") as mock_get:
+    with patch.object(api_client.session, "get") as mock_get:
         mock_response = MagicMock()
         mock_response.json.return_value = {"message": "success"}
         mock_response.raise_for_status.return_value = None
@@ -66,7 +77,7 @@ def test_get_request_success(api_client):
 @pytest.mark.utils
 def test_post_request_success(api_client):
     """Tests that APIClient.post returns JSON data on successful POST request."""
-    with patch("utils.api_utils.requests.post") as mock_post:
+    with patch.object(api_client.session, "post") as mock_post:
         mock_response = MagicMock()
         mock_response.json.return_value = {"status": "posted"}
         mock_response.raise_for_status.return_value = None
@@ -77,6 +88,143 @@ def test_post_request_success(api_client):
         mock_post.assert_called_once()
 
 
+@pytest.mark.utils
+def test_client_reuses_pooled_session(api_client):
+    """Tests that the client sends requests through one pooled session."""
+    adapter = api_client.session.get_adapter(BASE_URL)
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == POOL_MAXSIZE  # pylint:disable=protected-access
+
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = {}
+        api_client.get("/first")
+        api_client.get("/second")
+
+    assert mock_get.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.utils
+def test_client_enables_tcp_keepalive(api_client):
+    """Tests that pooled connections are opened with TCP keepalive enabled."""
+    adapter = api_client.session.get_adapter(BASE_URL)
+    assert isinstance(adapter, KeepAliveAdapter)
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+@pytest.mark.utils
+def test_client_retries_transient_get_failures_only(api_client):
+    """Tests that status retries apply to GET but not to POST."""
+    retry = api_client.session.get_adapter(BASE_URL).max_retries
+
+    assert retry.is_retry("GET", HTTPStatus.SERVICE_UNAVAILABLE)
+    assert not retry.is_retry("POST", HTTPStatus.SERVICE_UNAVAILABLE)
+    assert not retry.is_retry("GET", HTTPStatus.NOT_FOUND)
+    assert retry.backoff_jitter > 0
+
+
+@pytest.mark.utils
+def test_token_sets_session_authorization_header(api_client):
+    """Tests that the auth header is held on the session and follows token changes."""
+    assert api_client.session.headers["Authorization"] == f"Bearer {TOKEN}"
+
+    api_client.token = "rotated-token"  # noqa:S105
+
+    assert api_client.token == "rotated-token"  # noqa:S105
+    assert api_client.session.headers["Authorization"] == "Bearer rotated-token"
+
+
+@pytest.mark.utils
+def test_client_uses_configured_timeout(mock_api_logger):
+    """Tests that the timeout passed to the client is used for each request."""
+    test_api_client = APIClient(BASE_URL, TOKEN, mock_api_logger, timeout=5)
+
+    with patch.object(test_api_client.session, "post") as mock_post:
+        mock_post.return_value.json.return_value = {}
+        test_api_client.post("/submit", body={})
+
+    assert mock_post.call_args.kwargs["timeout"] == 5  # noqa: PLR2004
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize("encoding", [None, "x-unknown-charset"])
+def test_get_text_decodes_content_without_detection(api_client, encoding):
+    """Tests that text responses fall back to UTF-8 for a missing or unknown charset."""
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.return_value.encoding = encoding
+        mock_get.return_value.content = "Café".encode()
+        result = api_client.get("/text", return_json=False)
+
+    assert result == "Café"
+
+
+@pytest.mark.utils
+def test_close_closes_session_once(mock_api_logger):
+    """Tests that close releases the session and is safe to call twice."""
+    with patch("utils.api_utils.requests.Session") as mock_session:
+        test_api_client = APIClient(BASE_URL, TOKEN, mock_api_logger)
+        test_api_client.close()
+        test_api_client.close()
+
+    mock_session.return_value.close.assert_called_once()
+
+
+@pytest.mark.utils
+def test_circuit_breaker_opens_and_half_opens():
+    """Tests the closed, open and half-open transitions of the circuit breaker."""
+    breaker = CircuitBreaker(threshold=2, reset_timeout=30)
+
+    with patch("utils.api_utils.time.monotonic", return_value=100.0):
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow_request()
+
+    # After the reset timeout a single trial is let through
+    with patch("utils.api_utils.time.monotonic", return_value=131.0):
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+
+    assert not breaker.is_open
+    assert breaker.allow_request()
+
+
+@pytest.mark.utils
+def test_request_fails_fast_when_circuit_open(client, api_client):
+    """Tests that requests are not sent while the circuit is open."""
+    app = cast(SurveyAssistFlask, current_app)
+    api_client.breaker = CircuitBreaker(threshold=1)
+
+    with app.app_context(), patch.object(api_client.session, "get") as mock_get:
+        mock_get.side_effect = RequestsConnectionError()
+        _response, first_status = api_client.get("/down")
+        response, status_code = api_client.get("/down")
+
+    assert first_status == HTTPStatus.BAD_GATEWAY
+    assert status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response == {"error": "Circuit open"}
+    mock_get.assert_called_once()
+
+
+@pytest.mark.utils
+def test_request_rejected_when_bulkhead_full(client, api_client):
+    """Tests that a request is rejected when no concurrency slot is free."""
+    app = cast(SurveyAssistFlask, current_app)
+
+    with app.app_context(), patch.object(
+        api_client, "_bulkhead"
+    ) as mock_bulkhead, patch.object(api_client.session, "get") as mock_get:
+        mock_bulkhead.acquire.return_value = False
+        response, status_code = api_client.get("/busy")
+
+    assert status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response == {"error": "Too many concurrent requests"}
+    mock_get.assert_not_called()
+    mock_bulkhead.release.assert_not_called()
+
+
 @pytest.mark.utils
 def test_unsupported_method_error(client, api_client):
     """Tests that unsupported HTTP methods return an error and log appropriately."""
@@ -91,8 +239,7 @@ def test_unsupported_method_error(client, api_client):
 
         assert status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
-        json_data = response.get_json()
-        assert "Value error" in json_data["error"]
+        assert "Value error" in response["error"]
 
         mock_error.assert_called()
 
@@ -134,7 +281,7 @@ def test_request_error_handling(
     """
     app = cast(SurveyAssistFlask, current_app)
 
-    with app.app_context(), patch("utils.api_utils.requests.get") as mock_get:
+    with app.app_context(), patch.object(api_client.session, "get") as mock_get:
         if isinstance(exception, requests.exceptions.HTTPError):
             response_mock = MagicMock()
             response_mock.raise_for_status.side_effect = exception
@@ -143,7 +290,7 @@ def test_request_error_handling(
             mock_get.side_effect = exception
 
         response, status_code = api_client.get("/error-case")
-        assert expected_error in response.get_json()["error"]
+        assert expected_error in response["error"]
         assert status_code == expected_status
 
 
@@ -174,7 +321,7 @@ def test_handle_error_json_response(client, api_client):
             "Something went wrong", HTTPStatus.NOT_FOUND
         )
         assert result[1] == HTTPStatus.NOT_FOUND
-        assert result[0].json == {"error": "Something went wrong"}
+        assert result[0] == {"error": "Something went wrong"}
 
 
 POTENTIAL_CODES = 2
@@ -230,6 +377,40 @@ def test_map_to_lookup_response_empty_data() -> None:
     assert result.potential_codes_count == 0
 
 
+@pytest.mark.utils
+def test_map_to_lookup_response_limits_without_counts() -> None:
+    """Tests that limits apply to the returned lists when counts are missing."""
+    raw = {
+        "code": None,
+        "potential_matches": {
+            "codes": ["123", "456", "789"],
+            "divisions": [{"code": "A"}, {"code": "B", "meta": None}],
+        },
+    }
+
+    result = map_to_lookup_response(raw, max_codes=1, max_divisions=1)
+
+    assert [c.code for c in result.potential_codes] == ["123"]
+    assert [d.code for d in result.potential_divisions] == ["A"]
+    assert result.potential_divisions[0].title == ""
+
+
+@pytest.mark.parametrize(
+    "otp, expected",
+    [
+        ("ABCD-EFGH-IJKL-MNOP", "ABCD-****-****-****"),
+        ("-EFGH-IJKL-MNOP", "-****-****-****"),
+        ("ABCD-EFGH-IJKL", "***"),
+        ("ABCDEFGHIJKLMNOP", "***"),
+        ("", "***"),
+    ],
+)
+@pytest.mark.utils
+def test_mask_otp(otp: str, expected: str) -> None:
+    """Tests that only the first group of a four-group OTP is shown."""
+    assert mask_otp(otp) == expected
+
+
 def _make_validation_error(title: str = "FeedbackResult") -> ValidationError:
     """Build a Pydantic v2 ValidationError for use as a side_effect.
 
@@ -436,7 +617,9 @@ def test_verify_success_posts_and_validates_response(
 
     # Correct endpoint, payload, and masked logging
     mock_api.post.assert_called_once_with(
-        endpoint="/otp/verify", body={"id": "abc", "otp": "123456"}, return_json=True
+        endpoint="/otp/verify",
+        body={"id": "abc", "otp": "123456"},
+        return_json=True,
     )
     p_mask.assert_called_once_with("123456")
     mock_api.logger_handle.debug.assert_called()  # content checked implicitly by mask call
@@ -561,6 +744,56 @@ def test_delete_response_validation_error_wrapped_in_runtime_error(
     assert "Unexpected OTP delete response:" in str(err.value)
 
 
+@pytest.mark.parametrize(
+    ("call", "expected_error"),
+    [
+        (lambda svc: svc.verify("abc", "123456"), "OTP verify failed: HTTP error: 404"),
+        (lambda svc: svc.delete("abc"), "OTP delete failed: HTTP error: 404"),
+    ],
+)
+@pytest.mark.utils
+def test_otp_raises_on_client_error_tuple(
+    api_client: APIClient, call: Callable, expected_error: str
+) -> None:
+    """It should raise RuntimeError when the real client returns an error tuple."""
+    service = OTPVerificationService(api_client)
+    not_found = MagicMock(status_code=HTTPStatus.NOT_FOUND)
+    not_found.raise_for_status.side_effect = HTTPError(response=not_found)
+
+    with patch.object(
+        api_client.session, "post", return_value=not_found
+    ), pytest.raises(RuntimeError) as err:
+        call(service)
+
+    assert expected_error in str(err.value)
+
+
+@pytest.mark.parametrize(
+    ("call", "expected_error"),
+    [
+        (lambda svc: svc.verify("abc", "123456"), "OTP verify failed: HTTP error: 503"),
+        (lambda svc: svc.delete("abc"), "OTP delete failed: HTTP error: 503"),
+    ],
+)
+@pytest.mark.utils
+def test_otp_posts_are_not_retried(
+    api_client: APIClient, call: Callable, expected_error: str
+) -> None:
+    """It should send OTP POSTs once, without retrying transient server errors."""
+    service = OTPVerificationService(api_client)
+    unavailable = MagicMock(status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    unavailable.raise_for_status.side_effect = HTTPError(response=unavailable)
+
+    with patch.object(
+        api_client.session, "post", return_value=unavailable
+    ) as post, pytest.raises(RuntimeError) as err:
+        call(service)
+
+    # Verify and delete consume the OTP, so a resend could fail a valid login
+    post.assert_called_once()
+    assert expected_error in str(err.value)
+
+
 @pytest.mark.parametrize(
     ("base", "expected_verify_endpoint", "expected_delete_endpoint"),
     [
@@ -606,5 +839,7 @@ def test_base_path_endpoint_construction(
         mock_api.post.return_value = {"status": "deleted"}
         _ = service.delete("Y")
         mock_api.post.assert_called_with(
-            endpoint=expected_delete_endpoint, body={"id": "Y"}, return_json=True
+            endpoint=expected_delete_endpoint,
+            body={"id": "Y"},
+            return_json=True,
         )
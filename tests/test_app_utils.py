@@ -0,0 +1,185 @@
+"""Unit tests for the Flask application set-up utilities in Survey Assist UI.
+
+This module contains tests for loading the survey definition and for the helpers
+that freeze and thaw the configuration held on the app.
+"""
+
+import json
+from types import MappingProxyType
+
+import pytest
+
+from utils.app_types import SurveyAssistConfig
+from utils.app_utils import (
+    build_question_routing,
+    freeze,
+    load_survey_definition,
+    resolve_consent_text,
+    thaw,
+    validate_placeholder_fields,
+)
+
+
+class _App:  # pylint: disable=too-few-public-methods
+    """Minimal stand-in for the Flask app that accepts attribute assignment."""
+
+
+@pytest.mark.utils
+def test_freeze_converts_nested_containers():
+    """Tests that freeze returns read-only mappings and tuples at every level."""
+    frozen = freeze({"a": [1, {"b": [2, 3]}], "c": "text"})
+
+    assert isinstance(frozen, MappingProxyType)
+    assert isinstance(frozen["a"], tuple)
+    assert isinstance(frozen["a"][1], MappingProxyType)
+    assert frozen["a"][1]["b"] == (2, 3)
+    assert frozen["c"] == "text"
+
+    with pytest.raises(TypeError):
+        frozen["c"] = "changed"  # type: ignore[index]
+
+
+@pytest.mark.utils
+def test_thaw_round_trips_frozen_values():
+    """Tests that thaw restores plain dicts and lists that are JSON serialisable."""
+    original = {"a": [1, {"b": [2, 3]}], "c": "text"}
+
+    thawed = thaw(freeze(original))
+
+    assert thawed == original
+    assert isinstance(thawed["a"], list)
+    assert json.dumps(thawed) == json.dumps(original)
+
+
+@pytest.mark.utils
+def test_load_survey_definition_freezes_questions(tmp_path):
+    """Tests that questions and Survey Assist config are frozen on load."""
+    definition = {
+        "survey_title": "Test Survey",
+        "questions": [
+            {
+                "question_id": "q1",
+                "question_name": "job_title",
+                "response_name": "job-title",
+                "response_options": [],
+            }
+        ],
+        "survey_assist": {"consent": {"required": True}},
+        "feedback": {"enabled": True, "questions": []},
+    }
+    path = tmp_path / "survey_definition.json"
+    path.write_text(json.dumps(definition), encoding="utf-8")
+
+    app = _App()
+    load_survey_definition(app, path)
+
+    assert app.survey_title == "Test Survey"  # type: ignore[attr-defined]
+    assert app.survey_id == "test_survey"  # type: ignore[attr-defined]
+    assert isinstance(app.questions, tuple)  # type: ignore[attr-defined]
+    assert isinstance(app.survey_assist, MappingProxyType)  # type: ignore[attr-defined]
+    assert app.show_consent is True  # type: ignore[attr-defined]
+    assert app.question_routing == {  # type: ignore[attr-defined]
+        "job_title": ("job-title", True)
+    }
+    assert isinstance(app.feedback["questions"], list)  # type: ignore[attr-defined]
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    ("max_followup", "expected"),
+    [
+        (1, "Ask one additional question about your job?"),
+        (2, "Ask a maximum of two additional questions about your job?"),
+    ],
+)
+def test_resolve_consent_text(max_followup, expected):
+    """Tests that consent placeholders are replaced from the consent config."""
+    consent = {
+        "question_text": "Ask PLACEHOLDER_FOLLOWUP about PLACEHOLDER_REASON?",
+        "max_followup": max_followup,
+        "placeholder_reason": "your job",
+    }
+
+    assert resolve_consent_text(consent) == expected
+
+
+@pytest.mark.utils
+def test_load_survey_definition_invalid_json(tmp_path):
+    """Tests that invalid JSON raises a ValueError."""
+    path = tmp_path / "survey_definition.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        load_survey_definition(_App(), path)
+
+
+@pytest.mark.utils
+def test_validate_placeholder_fields_accepts_earlier_response():
+    """Tests that a placeholder may refer to an earlier question's response."""
+    questions = [
+        {"question_name": "q1", "response_name": "job-title", "placeholder_field": ""},
+        {
+            "question_name": "q2",
+            "response_name": "job-description",
+            "placeholder_field": "job_title",
+        },
+    ]
+
+    validate_placeholder_fields(questions)
+
+
+@pytest.mark.utils
+def test_validate_placeholder_fields_rejects_unknown_response():
+    """Tests that a placeholder referring to a later or unknown response is rejected."""
+    questions = [
+        {
+            "question_name": "q1",
+            "response_name": "job-description",
+            "placeholder_field": "job_title",
+        },
+        {"question_name": "q2", "response_name": "job-title", "placeholder_field": ""},
+    ]
+
+    with pytest.raises(ValueError, match="placeholder_field 'job_title'"):
+        validate_placeholder_fields(questions)
+
+
+@pytest.mark.utils
+def test_build_question_routing():
+    """Tests that questions are indexed by name with a last-question flag."""
+    questions = [
+        {"question_name": "job_title", "response_name": "job-title"},
+        {"question_name": "org_description", "response_name": "org-description"},
+    ]
+
+    routing = build_question_routing(questions)
+
+    assert routing == {
+        "job_title": ("job-title", False),
+        "org_description": ("org-description", True),
+    }
+
+
+@pytest.mark.utils
+def test_survey_assist_config_from_mapping():
+    """Tests that the first interaction settings are derived from the config."""
+    config = SurveyAssistConfig.from_mapping(
+        freeze(
+            {
+                "enabled": True,
+                "interactions": [
+                    {
+                        "after_question_id": "q4",
+                        "type": "lookup_classification",
+                        "param": "sic",
+                    }
+                ],
+            }
+        )
+    )
+
+    assert config == SurveyAssistConfig(
+        interaction_after_question_id="q4",
+        interaction_param="sic",
+    )
+    assert SurveyAssistConfig.from_mapping({}).interaction_after_question_id is None
@@ -0,0 +1,63 @@
+"""Unit tests for the caching utilities in Survey Assist UI.
+
+This module contains tests for the in-process response cache used to avoid
+repeating identical API requests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.cache_utils import ResponseCache
+
+
+@pytest.mark.utils
+def test_response_cache_get_and_set():
+    """Tests that a stored value is returned and a missing key returns None."""
+    cache = ResponseCache(maxsize=2)
+    cache.set("nhs", {"code": "86101"})
+
+    assert cache.get("nhs") == {"code": "86101"}
+    assert cache.get("tesco") is None
+
+
+@pytest.mark.utils
+def test_response_cache_evicts_least_recently_used():
+    """Tests that the least recently used entry is evicted when the cache is full."""
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+@pytest.mark.utils
+def test_response_cache_clear():
+    """Tests that clear removes all entries."""
+    cache = ResponseCache()
+    cache.set("a", 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+@pytest.mark.utils
+def test_response_cache_expires_entries_after_ttl():
+    """Tests that entries are dropped once their time to live has passed."""
+    cache = ResponseCache(ttl=60)
+    with patch("utils.cache_utils.time.monotonic", return_value=1000.0):
+        cache.set("nhs", {"code": "86101"})
+
+    with patch("utils.cache_utils.time.monotonic", return_value=1059.0):
+        assert cache.get("nhs") == {"code": "86101"}
+
+    with patch("utils.cache_utils.time.monotonic", return_value=1060.0):
+        assert cache.get("nhs") is None
+
+    assert len(cache) == 0
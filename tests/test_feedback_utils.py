@@ -13,7 +13,7 @@ from tests.conftest import LogCapture, SessionDict
 from utils.feedback_utils import (  # pylint: disable=wrong-import-position
     FeedbackSession,
     _make_feedback_session,
-    _selected_ids_selector,
+    _requested_ids,
     copy_feedback_from_survey_iteration,
     get_current_feedback_index,
     get_feedback_questions,
@@ -22,75 +22,53 @@ from utils.feedback_utils import (  # pylint: disable=wrong-import-position
 from utils.session_utils import FIRST_QUESTION
 
 
+@pytest.mark.parametrize("empty_value", [None, [], (), set()])  # type: ignore[list-item, arg-type]
 @pytest.mark.utils
-def test_returns_all_ids_when_question_ids_is_none(
-    sample_questions: list[dict[str, Any]],
+def test_requested_ids_none_or_empty_selects_all(
+    empty_value: Sequence[str] | None,
 ) -> None:
-    """It should return all IDs when ``question_ids`` is ``None``."""
-    result = _selected_ids_selector(sample_questions, None)
-    assert result == {"q1", "q2", "q3"}
+    """It should select every question when ``question_ids`` is ``None`` or empty."""
+    assert _requested_ids(empty_value) is None
 
 
-@pytest.mark.parametrize("empty_value", [[], (), set()])  # type: ignore[list-item, arg-type]
 @pytest.mark.utils
-def test_returns_all_ids_when_question_ids_is_empty_sequence(
-    sample_questions: list[dict[str, Any]],
-    empty_value: Sequence[str],
-) -> None:
-    """It should return all IDs when ``question_ids`` is an empty sequence."""
-    result = _selected_ids_selector(sample_questions, empty_value)
-    assert result == {"q1", "q2", "q3"}
-
-
-@pytest.mark.utils
-def test_accepts_single_string_returns_singleton_set(
-    sample_questions: list[dict[str, Any]],
-) -> None:
+def test_requested_ids_accepts_single_string() -> None:
     """It should accept a single string and return a singleton set."""
-    result = _selected_ids_selector(sample_questions, "q2")
-    assert result == {"q2"}
+    assert _requested_ids("q2") == {"q2"}
 
 
 @pytest.mark.utils
-def test_accepts_sequence_of_strings_and_deduplicates(
-    sample_questions: list[dict[str, Any]],
-) -> None:
+def test_requested_ids_deduplicates_sequence() -> None:
     """It should accept a sequence and naturally deduplicate into a set."""
-    result = _selected_ids_selector(sample_questions, ["q1", "q1", "q3"])
-    assert result == {"q1", "q3"}
-
-
-@pytest.mark.utils
-def test_raises_value_error_for_missing_single_id(
-    sample_questions: list[dict[str, Any]],
-) -> None:
-    """It should raise ``ValueError`` when any requested ID is absent."""
-    with pytest.raises(ValueError) as err:
-        _selected_ids_selector(sample_questions, "q9")
-
-    # Exact message shape matters to callers that log/propagate errors.
-    assert "question_id(s) not found: ['q9']" in str(err.value)
+    assert _requested_ids(["q1", "q1", "q3"]) == {"q1", "q3"}
 
 
 @pytest.mark.utils
 def test_raises_value_error_lists_missing_ids_sorted(
-    sample_questions: list[dict[str, Any]],
+    session_ready: dict[str, Any],
 ) -> None:
     """It should report missing IDs as a sorted list in the error message."""
     with pytest.raises(ValueError) as err:
-        _selected_ids_selector(sample_questions, ["q9", "q0", "q8"])
+        copy_feedback_from_survey_iteration(
+            session_ready, question_ids=["q9", "a0", "q1", "q8"]
+        )
 
-    # Expect alphabetical sort in the rendered list
-    assert "question_id(s) not found: ['q0', 'q8', 'q9']" in str(err.value)
+    # Exact message shape matters to callers that log/propagate errors.
+    assert "question_id(s) not found: ['a0', 'q8', 'q9']" in str(err.value)
 
 
 @pytest.mark.utils
-def test_includes_empty_string_when_question_lacks_id(
+def test_copy_all_skips_question_without_id(
     questions_with_missing_id: list[dict[str, Any]],
+    empty_feedback_session: FeedbackSession,
 ) -> None:
-    """It should include the empty string ID when a question lacks ``question_id``."""
-    result = _selected_ids_selector(questions_with_missing_id, None)
-    assert result == {"q1", ""}
+    """It should not copy a question that lacks a ``question_id``."""
+    session_data: dict[str, Any] = {
+        "survey_iteration": {"questions": questions_with_missing_id},
+        "feedback_response": empty_feedback_session,
+    }
+    dest = copy_feedback_from_survey_iteration(session_data)
+    assert len(dest["questions"]) == 1
 
 
 @pytest.mark.utils
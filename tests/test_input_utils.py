@@ -93,25 +93,26 @@ def test_detect_injection_none_or_harmless_returns_false(
 
 @pytest.mark.utils
 @pytest.mark.parametrize(
-    ("word", "target", "expected"),
+    ("word", "expected"),
     [
-        (None, "ignore", False),  # None is never similar
-        ("ignroe", "ignore", True),  # typoglycaemia variant, same length
-        ("ignore", "ignore", True),  # exact match still passes similarity check
-        ("ignroes", "ignore", False),  # different length
-        ("inorqe", "ignore", False),  # wrong letters internally
-        ("ign", "ignore", False),  # below MIN_WORD_LEN guard or length mismatch
+        (None, False),  # None is never similar
+        ("ignroe", True),  # typoglycaemia variant, same length
+        ("ignore", True),  # exact match still passes similarity check
+        ("ignroes", False),  # different length
+        ("inorqe", False),  # wrong letters internally
+        ("ign", False),  # below MIN_WORD_LEN guard or length mismatch
     ],
 )
-def test_is_similar_word_private_contract(
-    inj_filter: PromptInjectionFilter, word: str | None, target: str, expected: bool
+def test_detect_injection_typoglycaemia_similarity_rules(
+    inj_filter: PromptInjectionFilter, word: str | None, expected: bool
 ) -> None:
     """It respects typoglycaemia similarity rules including length and character set."""
-    # Access the private method intentionally to assert its contract is stable.
-    result = inj_filter._is_similar_word(
-        word, target
-    )  # pylint: disable=protected-access
-    assert result is expected
+    detected, reason = inj_filter.detect_injection(word)
+    assert detected is expected
+    if expected:
+        assert reason == f"Fuzzy match: input word '{word}' similar to 'ignore'"
+    else:
+        assert reason is None
 
 
 # -------------------------
@@ -272,6 +272,21 @@ def test_placeholder_survey_question(granted_access, mock_questions) -> None:
         ), "Expected 'Save and continue' in response"
 
 
+@pytest.mark.route
+def test_save_response_missing_question_name(granted_access) -> None:
+    """Tests that save_response rejects a form without a question_name.
+
+    Args:
+        granted_access: Flask test client fixture.
+    """
+    response = granted_access.post("/save_response", data={})
+
+    assert (
+        response.status_code == HTTPStatus.BAD_REQUEST
+    ), "save_response should return 400 when question_name is missing"
+    assert b"Invalid question ID" in response.data
+
+
 @pytest.mark.route
 def test_survey_assist_consent(granted_access, mock_survey_assist) -> None:
     """Tests that the consent route returns a 200 OK response.
@@ -337,6 +352,51 @@ def test_survey_summary_param(
         assert response.headers["Location"].endswith(url_for("survey.survey_result"))
 
 
+@pytest.mark.route
+def test_survey_summary_does_not_modify_session_text(
+    granted_access, mock_survey_iteration
+) -> None:
+    """Tests that the Survey Assist label is not appended to session question text.
+
+    Args:
+        granted_access: Flask test client fixture.
+        mock_survey_iteration: Mocked survey iteration data.
+    """
+    app: SurveyAssistFlask = current_app  # type: ignore
+    app.survey_summary = True
+    label = app.survey_assist["question_assist_label"]
+
+    with granted_access.session_transaction() as sess:
+        sess["survey_iteration"] = mock_survey_iteration
+        sess.modified = True
+
+    # Render the summary twice to mimic the user reloading the page
+    granted_access.get("/summary")
+    response = granted_access.get("/summary")
+
+    assert response.status_code == HTTPStatus.OK, "summary should return 200 OK"
+
+    with granted_access.session_transaction() as sess:
+        for question in sess["survey_iteration"]["questions"]:
+            assert label not in question["question_text"]
+
+
+@pytest.mark.route
+def test_survey_summary_without_iteration(granted_access) -> None:
+    """Tests that the summary route redirects to the index with no survey in session.
+
+    Args:
+        granted_access: Flask test client fixture.
+    """
+    response = granted_access.get("/summary", follow_redirects=False)
+
+    assert response.status_code in (
+        HTTPStatus.FOUND,
+        HTTPStatus.SEE_OTHER,
+    ), "summary should redirect when there is no survey iteration"
+    assert response.headers["Location"].endswith(url_for("main.index"))
+
+
 @pytest.mark.route
 def test_thank_you_route(granted_access) -> None:
     """Tests that the survey thank you route contains survey title and returns a 200 OK response.
@@ -32,6 +32,7 @@ from utils.session_utils import (
     add_question_to_survey,
     add_sic_lookup_interaction,
     get_encoded_session_size,
+    init_survey_result,
     load_model_from_session,
     print_session_info,
     remove_model_from_session,
@@ -69,6 +70,27 @@ def test_session_debug_decorator_calls_view_and_prints(
         mock_print.assert_called_once()
 
 
+@pytest.mark.utils
+def test_session_debug_decorator_disabled_skips_print(
+    client,
+):  # pylint:disable=unused-argument
+    """Tests that session_debug does not print when SESSION_DEBUG config is off."""
+    app = cast(SurveyAssistFlask, current_app)
+
+    def test_view():
+        return "ok"
+
+    with patch("utils.session_utils.print_session_info") as mock_print:
+        decorated = session_debug(test_view)
+
+        with app.app_context():
+            app.config["SESSION_DEBUG"] = False
+            result = decorated()
+
+    assert result == "ok"
+    mock_print.assert_not_called()
+
+
 @pytest.mark.utils
 def test_convert_datetimes_dict():
     """Tests that datetime values in a dictionary are converted to ISO format."""
@@ -424,6 +446,25 @@ def test_load_model_from_session(
         assert loaded.responses[0].survey_assist_interactions[0].flavour == "sic"
 
 
+@pytest.mark.utils
+def test_init_survey_result(app) -> None:
+    """Initialise survey_result with a single response for the respondent."""
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    with app.test_request_context():
+        session["participant_id"] = "case-1"
+        init_survey_result(now)
+
+        loaded = load_model_from_session("survey_result", GenericSurveyAssistResult)
+
+    assert loaded.survey_id == app.survey_id
+    assert loaded.case_id == "case-1"
+    assert loaded.time_start == now
+    assert loaded.time_end == now
+    assert len(loaded.responses) == 1
+    assert loaded.responses[0].person_id == "case-1-01"
+    assert loaded.responses[0].survey_assist_interactions == []
+
+
 @pytest.mark.utils
 def test_remove_model_from_session(
     app, nested_survey_result_model: GenericSurveyAssistResult
@@ -18,7 +18,6 @@ from utils.app_types import SurveyAssistFlask
 from utils.survey_assist_utils import (
     classify,
     classify_and_handle_followup,
-    classify_and_redirect,
     format_followup,
     get_next_followup,
     perform_sic_lookup,
@@ -195,7 +194,7 @@ def test_perform_sic_lookup(app, client, mock_api_client):
 
         # Assert correct URL was called
         expected_url = (
-            f"/survey-assist/sic-lookup?description={test_description}&similarity=true"
+            "/survey-assist/sic-lookup?description=education+services&similarity=true"
         )
         mock_api_client.get.assert_called_once_with(endpoint=expected_url)
 
@@ -207,26 +206,52 @@ def test_perform_sic_lookup(app, client, mock_api_client):
 
 
 @pytest.mark.utils
-def test_classify_and_redirect_redirects_to_question_template(app):
-    """Tests that classify_and_redirect performs classification and redirects."""
-    with patch("utils.survey_assist_utils.classify") as mock_classify, patch(
-        "utils.survey_assist_utils.url_for"
-    ) as mock_url_for:
+def test_perform_sic_lookup_encodes_description(app, client, mock_api_client):
+    """Tests that reserved characters in the description are URL-encoded."""
+    app = cast(SurveyAssistFlask, current_app)
+    mock_api_client.get.return_value = {}
 
-        mock_classify.return_value = {"result": "classified"}
-        mock_url_for.return_value = "/survey/question-template"
+    with patch.object(app, "api_client", mock_api_client), app.test_request_context():
+        perform_sic_lookup("Fish & chips = café")
 
-        with app.test_request_context():
-            response = classify_and_redirect(
-                job_title="Software Engineer",
-                job_description="Develop and maintain software",
-                org_description="Tech startup",
-            )
-
-        mock_classify.assert_called_once()
-        mock_url_for.assert_called_once_with("survey.question_template")
-        assert response.status_code == HTTPStatus.FOUND
-        assert response.location == "/survey/question-template"
+    mock_api_client.get.assert_called_once_with(
+        endpoint="/survey-assist/sic-lookup?description=Fish+%26+chips+%3D+caf%C3%A9&similarity=true"
+    )
+
+
+@pytest.mark.utils
+def test_perform_sic_lookup_reuses_cached_response(app, client, mock_api_client):
+    """Tests that repeat lookups for the same query are served from the cache."""
+    app = cast(SurveyAssistFlask, current_app)
+    expected_response = {"code": "85600", "description": "Education"}
+    mock_api_client.get.return_value = expected_response
+
+    with patch.object(app, "api_client", mock_api_client), app.test_request_context():
+        first, _start_time, _end_time = perform_sic_lookup("Education services")
+        second, _start_time, _end_time = perform_sic_lookup("Education services")
+        perform_sic_lookup("education services")
+
+    assert first == expected_response
+    assert second == expected_response
+    # Only a byte-identical query is served from the cache
+    assert mock_api_client.get.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.utils
+def test_perform_sic_lookup_does_not_cache_errors(app, client, mock_api_client):
+    """Tests that an error response from the API is not cached."""
+    app = cast(SurveyAssistFlask, current_app)
+    mock_api_client.get.return_value = (
+        {"error": "Request timed out"},
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+
+    with patch.object(app, "api_client", mock_api_client), app.test_request_context():
+        perform_sic_lookup("education services")
+        perform_sic_lookup("education services")
+
+    assert mock_api_client.get.call_count == 2  # noqa: PLR2004
+    assert len(app.sic_lookup_cache) == 0
 
 
 # Needs rework
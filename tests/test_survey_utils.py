@@ -15,6 +15,7 @@ from flask import Request, session, url_for
 import utils.survey_utils as sut
 from models.result import GenericSurveyAssistResult
 from tests.conftest import LogCapture
+from utils.app_types import SurveyAssistConfig
 from utils.survey_utils import (
     check_route_on_response,
     consent_redirect,
@@ -159,6 +160,18 @@ def test_get_question_routing_valid(
         assert route == expected_route
 
 
+@pytest.mark.utils
+def test_get_question_routing_uses_prebuilt_index(app):
+    """Tests that a prebuilt routing index is used instead of the question list."""
+    with app.test_request_context():
+        response_name, route = get_question_routing(
+            "job_title", [], {"job_title": ("job-title", False)}
+        )
+
+    assert response_name == "job-title"
+    assert route == "survey.survey"
+
+
 @pytest.mark.utils
 def test_get_question_routing_invalid_question_name():
     """Tests ValueError is raised for unknown question name."""
@@ -296,6 +309,9 @@ def test_followup_redirect_redirects_to_next_core_question(
         mock_app.survey_assist = {
             "interactions": [{"after_question_id": "q1"}],
         }
+        mock_app.survey_assist_config = SurveyAssistConfig.from_mapping(
+            mock_app.survey_assist
+        )
 
         with patch("utils.survey_utils.current_app", mock_app):
             response = followup_redirect()
@@ -323,6 +339,9 @@ def test_followup_redirect_to_error_when_no_interaction_match(
         mock_app.survey_assist = {
             "interactions": [{"after_question_id": "q1"}],  # Different ID
         }
+        mock_app.survey_assist_config = SurveyAssistConfig.from_mapping(
+            mock_app.survey_assist
+        )
 
         with patch("utils.survey_utils.current_app", mock_app):
             response = followup_redirect()
@@ -4,6 +4,7 @@ This module provides an functionality used to verify access to the Survey Assist
 
 """
 
+import logging
 import os
 import re
 from typing import cast
@@ -12,16 +13,12 @@ from flask import Request, current_app, redirect, session
 from flask.typing import ResponseReturnValue
 from survey_assist_utils.logging import get_logger
 
-from utils.api_utils import (
-    OTPVerificationService,
-    get_verification_api_id_token,
-    mask_otp,
-)
+from utils.api_utils import get_verification_api_id_token, mask_otp
 from utils.app_types import SurveyAssistFlask
 
 logger = get_logger(__name__, level="INFO")
 
-FILENAME = "example_access.csv"
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 def validate_access(access_id: str, access_code: str) -> tuple[bool, str]:
@@ -34,25 +31,27 @@ def validate_access(access_id: str, access_code: str) -> tuple[bool, str]:
     Returns:
         tuple[bool, str]: Tuple of (True, "") if valid, or (False, error message) if not.
     """
-    logger.debug(f"Validate access for {access_id} : {mask_otp(access_code)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Validate access for %s : %s", access_id, mask_otp(access_code))
     error_string = "Invalid credentials. Please try again."
     if not access_code:
-        logger.warning(f"Empty access code entered for access_id: {access_id}")
+        logger.warning("Empty access code entered for access_id: %s", access_id)
         return False, "You must enter both ONS ID and PFR ID"
     try:
         app = cast(SurveyAssistFlask, current_app)
-        verify_service = OTPVerificationService(app.verify_api_client)
-        verify_resp = verify_service.verify(id_str=access_id, otp=access_code)
+        verify_resp = app.otp_service.verify(id_str=access_id, otp=access_code)
 
         if verify_resp.verified is True:
             return True, ""
         else:
             logger.warning(
-                f"Validation unsuccessful for participant_id:{access_id} - {verify_resp.message}"
+                "Validation unsuccessful for participant_id:%s - %s",
+                access_id,
+                verify_resp.message,
             )
             return False, error_string
     except RuntimeError as e:
-        logger.warning(f"participant_id:{access_id} error validating user: {e}")
+        logger.warning("participant_id:%s error validating user: %s", access_id, e)
     return False, "Error in validation module"
 
 
@@ -65,26 +64,27 @@ def delete_access(access_id: str) -> tuple[bool, str]:
     Returns:
         tuple[bool, str]: Tuple of (True, "") if valid, or (False, error message) if not.
     """
-    logger.info(f"Delete access for {access_id}")
+    logger.info("Delete access for %s", access_id)
     error_string = f"Invalid id {access_id}. Not deleted."
     if not access_id:
         logger.error("Access id not set. Not deleted.")
         return False, "ID not set in session"
     try:
         app = cast(SurveyAssistFlask, current_app)
-        verify_service = OTPVerificationService(app.verify_api_client)
-        delete_resp = verify_service.delete(id_str=access_id)
+        delete_resp = app.otp_service.delete(id_str=access_id)
 
         if delete_resp.deleted is True:
-            logger.info(f"Access code deleted for participant_id:{access_id}")
+            logger.info("Access code deleted for participant_id:%s", access_id)
             return True, ""
         else:
             logger.warning(
-                f"Deletion unsuccessful for participant_id:{access_id} - {delete_resp.message}"
+                "Deletion unsuccessful for participant_id:%s - %s",
+                access_id,
+                delete_resp.message,
             )
             return False, error_string
     except RuntimeError as e:
-        logger.error(f"participant_id:{access_id} error deleting access: {e}")
+        logger.error("participant_id:%s error deleting access: %s", access_id, e)
     return False, "Error in validation module when deleting access code"
 
 
@@ -101,7 +101,7 @@ def format_access_code(raw: str) -> str:
         str: The formatted access code as uppercase with hyphens.
     """
     # trims ends and turns any run of spaces/tabs into a single hyphen
-    return re.sub(r"\s+", "-", raw.strip()).upper()
+    return WHITESPACE_PATTERN.sub("-", raw.strip()).upper()
 
 
 def require_access() -> ResponseReturnValue | None:
@@ -142,7 +142,9 @@ def update_tokens_on_api_clients(
     if hasattr(flask_app, "api_client"):
         flask_app.api_client.token = new_sa_token
         logger.info(
-            f"Survey Assist API token refresh Rx Method:{request.method} Route:{request.endpoint}"
+            "Survey Assist API token refresh Rx Method:%s Route:%s",
+            request.method,
+            request.endpoint,
         )
     else:
         logger.error("Survey Assist API token refresh - API client not initialised!")
@@ -157,7 +159,9 @@ def update_tokens_on_api_clients(
         # Update client
         flask_app.verify_api_client.token = flask_app.verify_api_token
         logger.info(
-            f"Verify API token refresh Rx Method: {request.method} - Route: {request.endpoint}"
+            "Verify API token refresh Rx Method: %s - Route: %s",
+            request.method,
+            request.endpoint,
         )
     else:
         logger.error("Verify API token refresh - API client not initialised!")
@@ -9,8 +9,16 @@ poetry run python scripts/run_api.py --type sic --action classify
 poetry run python scripts/run_api.py --type sic --action both
 """
 
+import functools
+import logging
 import os
+import socket
+import threading
+import time
+import weakref
+from collections.abc import Mapping
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any, Optional
 
 import google.auth
@@ -21,11 +29,12 @@ from firestore_otp_verification_api_client import (
     OtpVerifyRequest,
     OtpVerifyResponse,
 )
-from flask import jsonify, redirect, url_for
+from flask import redirect, url_for
 from google.auth.exceptions import DefaultCredentialsError
 from google.auth.transport.requests import Request
 from google.oauth2 import id_token as oauth_id_token
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter, Retry
 from survey_assist_utils.logging import get_logger
 
 from models.result import (
@@ -35,9 +44,156 @@ from models.result import (
 )
 
 API_TIMER_SEC = 60
+# Connection pool sizing for the keep-alive session held by each APIClient
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+# Backoff between retries of transient upstream failures, with random jitter so
+# that clients recovering from the same blip do not retry in lockstep
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.25
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_BACKOFF_MAX = 30
+# Consecutive upstream failures before requests fail fast, and how long to wait
+# before letting a trial request through again
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_SEC = 30
+# How long a request waits for a free slot when every pooled connection is busy
+BULKHEAD_WAIT_SEC = 5
+# TCP keepalive probes stop idle pooled connections being silently dropped by
+# NAT gateways and load balancers. TCP_NODELAY matches the urllib3 default.
+KEEPALIVE_IDLE_SEC = 60
+KEEPALIVE_INTERVAL_SEC = 10
+KEEPALIVE_PROBES = 3
+KEEPALIVE_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+# The tuning options are not available on every platform (e.g. macOS)
+for _name, _value in (
+    ("TCP_KEEPIDLE", KEEPALIVE_IDLE_SEC),
+    ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL_SEC),
+    ("TCP_KEEPCNT", KEEPALIVE_PROBES),
+):
+    if hasattr(socket, _name):
+        KEEPALIVE_SOCKET_OPTIONS.append(
+            (socket.IPPROTO_TCP, getattr(socket, _name), _value)
+        )
+
 logger = get_logger(__name__, level="INFO")
 
 
+class LoggingRetry(Retry):
+    """Retry policy that logs each retry attempt."""
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        """Records a failed attempt and logs the retry that follows.
+
+        Args:
+            method (str, optional): The HTTP method of the failed request.
+            url (str, optional): The URL of the failed request.
+            *args: Positional arguments passed to Retry.increment.
+            **kwargs: Keyword arguments passed to Retry.increment.
+
+        Returns:
+            LoggingRetry: The retry state for the next attempt.
+        """
+        new_retry = super().increment(method, url, *args, **kwargs)
+        logger.warning("Retrying %s %s, %s retries left", method, url, new_retry.total)
+        return new_retry
+
+
+# Status and read retries apply to GET only; a POST is only retried when the
+# connection could not be established, so it is never sent twice. Read
+# timeouts are not retried, keeping the worst case within a single request
+# timeout.
+API_RETRY = LoggingRetry(
+    total=RETRY_TOTAL,
+    read=0,
+    backoff_factor=RETRY_BACKOFF_FACTOR,
+    backoff_jitter=RETRY_BACKOFF_JITTER,
+    backoff_max=RETRY_BACKOFF_MAX,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
+class CircuitBreaker:
+    """Tracks upstream failures and fails fast while an API is unavailable.
+
+    The breaker is closed while requests succeed. After ``threshold`` consecutive
+    failures it opens and rejects requests for ``reset_timeout`` seconds, after
+    which a single trial request is allowed through (half-open). A successful
+    trial closes the breaker again; a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_SEC,
+    ) -> None:
+        """Initialises a closed circuit breaker.
+
+        Args:
+            threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds to stay open before allowing a trial.
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """bool: True while the breaker is open or half-open."""
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        """Returns whether a request may be sent to the upstream API.
+
+        Returns:
+            bool: False while the breaker is open, True otherwise.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # Half-open: let one trial through and restart the clock so other
+            # requests keep failing fast until the trial completes
+            self._opened_at = time.monotonic()
+            return True
+
+    def record_success(self) -> None:
+        """Records a response from the upstream API and closes the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Records an upstream failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections enable TCP keepalive probes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialises the pool manager with keepalive socket options.
+
+        Args:
+            *args: Positional arguments passed to HTTPAdapter.init_poolmanager.
+            **kwargs: Keyword arguments passed to HTTPAdapter.init_poolmanager.
+        """
+        kwargs["socket_options"] = KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 # Disabling pylint warning for too many arguments/locals in APIClient class
 # This is to maintain clarity in the APIClient constructor and methods.
 # pylint: disable=too-many-arguments,too-many-positional-arguments, too-many-locals
@@ -46,10 +202,18 @@ class APIClient:
 
     This class provides methods for sending GET and POST requests, handling errors,
     and managing authentication for API calls within a Flask application.
+
+    Requests are sent through a single requests.Session so that TCP and TLS
+    connections to the API are pooled and reused between calls.
     """
 
     def __init__(
-        self, base_url: str, token: str, logger_handle, redirect_on_error: bool = False
+        self,
+        base_url: str,
+        token: str,
+        logger_handle,
+        redirect_on_error: bool = False,
+        timeout: float = API_TIMER_SEC,
     ):
         """Initialises the API client with base URL, token, and logger.
 
@@ -58,19 +222,45 @@ class APIClient:
             token (str): The authentication token for API requests.
             logger_handle: Logger instance for logging messages.
             redirect_on_error (bool): Whether to redirect on error.
+            timeout (float): Seconds to wait for the API before giving up.
         """
         self.base_url = base_url
-        self.token = token
         self.logger_handle = logger_handle
         self.redirect_on_error = redirect_on_error
+        self.timeout = timeout
 
-    def _default_headers(self):
-        """Returns the default headers for API requests.
+        self.session = requests.Session()
+        self.token = token
+        adapter = KeepAliveAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=API_RETRY,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.breaker = CircuitBreaker()
+        self._bulkhead = threading.BoundedSemaphore(POOL_MAXSIZE)
+        # Release pooled sockets when the client is discarded or at interpreter exit
+        self._finalizer = weakref.finalize(self, self.session.close)
 
-        Returns:
-            dict: Dictionary containing the authorisation header.
+    def close(self) -> None:
+        """Closes the underlying session and its pooled connections.
+
+        Safe to call more than once.
         """
-        return {"Authorization": f"Bearer {self.token}"}
+        self._finalizer()
+
+    @property
+    def token(self) -> str:
+        """str: The authentication token sent with every request."""
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        # The authorisation header is built once per token and carried by the
+        # session, so requests only need to pass explicit header overrides.
+        self._token = value
+        self.session.headers["Authorization"] = f"Bearer {value}"
 
     def get(
         self,
@@ -127,7 +317,7 @@ class APIClient:
             return_json=return_json,
         )
 
-    def _request(  # noqa: PLR0913, C901
+    def _request(  # noqa: PLR0913
         self,
         method: str,
         endpoint: str,
@@ -153,84 +343,174 @@ class APIClient:
             ValueError: If an unsupported HTTP method is provided.
         """
         url = f"{self.base_url}{endpoint}"
-        combined_headers = {**self._default_headers(), **(headers or {})}
 
         if logger_handle is None:
             logger_handle = self.logger_handle
 
-        logger_handle.debug(f"Sending {method} request to {url}")
+        debug_enabled = logger_handle.isEnabledFor(logging.DEBUG)
+        logger_handle.debug("Sending %s request to %s", method, url)
 
         # GET requests don't contain a body
-        if body is not None:
+        if body is not None and debug_enabled:
             logger_handle.debug(body)
-        data = None
-        error = None
-        status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        blocked = self._acquire_slot(logger_handle, url)
+        if blocked is not None:
+            return blocked
 
         try:
             if method == "GET":
-                response = requests.get(
-                    url, headers=combined_headers, timeout=API_TIMER_SEC
-                )
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
             elif method == "POST":
-                response = requests.post(
-                    url, json=body, headers=combined_headers, timeout=API_TIMER_SEC
+                response = self.session.post(
+                    url, json=body, headers=headers, timeout=self.timeout
                 )
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
             response.raise_for_status()
-            data = response.json() if return_json else response.text
-            logger_handle.debug(f"Received response from {url}")
-            logger_handle.debug(data)
+            self.breaker.record_success()
+            data = response.json() if return_json else self._decode_text(response)
+            logger_handle.debug("Received response from %s", url)
+            if debug_enabled:
+                logger_handle.debug(data)
+
+        except (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.HTTPError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+        ) as exc:
+            error, status_code = self._classify_exception(exc, logger_handle, url)
+            return self._handle_error(error, status_code)
+        finally:
+            self._bulkhead.release()
+
+        return data
+
+    @staticmethod
+    def _decode_text(response: requests.Response) -> str:
+        """Decodes a text response body.
 
-        except requests.exceptions.Timeout:
+        The body is decoded directly rather than via ``response.text``, which
+        falls back to charset detection when the API omits a charset.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            str: The decoded body, using UTF-8 when the charset is missing or
+            not recognised.
+        """
+        try:
+            return response.content.decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+        except LookupError:
+            return response.content.decode("utf-8", errors="replace")
+
+    def _acquire_slot(self, logger_handle, url: str):
+        """Checks the circuit breaker and takes a slot in the bulkhead.
+
+        The caller must release the bulkhead once the request completes.
+
+        Args:
+            logger_handle: Logger instance for logging messages.
+            url (str): The full URL about to be requested.
+
+        Returns:
+            tuple | None: An error payload if the request must not be sent,
+            otherwise None.
+        """
+        # Fail fast rather than wait for a timeout while the API is down
+        if not self.breaker.allow_request():
+            logger_handle.warning("Circuit open for %s, skip %s", self.base_url, url)
+            return self._handle_error("Circuit open", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        # Cap concurrent in-flight calls to the size of the connection pool
+        if not self._bulkhead.acquire(timeout=BULKHEAD_WAIT_SEC):
+            logger_handle.warning("Too many concurrent requests to %s", self.base_url)
+            return self._handle_error(
+                "Too many concurrent requests", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        return None
+
+    def _classify_exception(
+        self, exc: Exception, logger_handle, url: str
+    ) -> tuple[str, HTTPStatus]:
+        """Maps a failed request to an error message and records the outcome.
+
+        Args:
+            exc (Exception): The exception raised while sending the request.
+            logger_handle: Logger instance for logging messages.
+            url (str): The full URL that was requested.
+
+        Returns:
+            tuple[str, HTTPStatus]: The error message and status code to return.
+        """
+        status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+        if isinstance(exc, requests.exceptions.Timeout):
             logger_handle.error(
-                f"Request to {url} timed out after {API_TIMER_SEC} seconds"
+                "Request to %s timed out after %s seconds", url, self.timeout
             )
             error = "Request timed out"
             status_code = HTTPStatus.GATEWAY_TIMEOUT
-        except requests.exceptions.ConnectionError:
-            logger_handle.error(f"Failed to connect to API at {url}")
+            self.breaker.record_failure()
+        elif isinstance(exc, requests.exceptions.ConnectionError):
+            logger_handle.error("Failed to connect to API at %s", url)
             error = "Failed to connect to API"
             status_code = HTTPStatus.BAD_GATEWAY
-        except requests.exceptions.HTTPError as http_err:
-            logger_handle.error(f"HTTP error occurred: {http_err}")
-            error = f"HTTP error: {http_err.response.status_code}"
-        except ValueError as val_err:
-            logger_handle.error(f"Value error: {val_err}")
-            error = f"Value error: {val_err}"
-        except KeyError as key_err:
-            logger_handle.error(f"Missing expected data in response: {key_err}")
-            error = f"Missing expected data: {key_err}"
+            self.breaker.record_failure()
+        elif isinstance(exc, requests.exceptions.HTTPError):
+            logger_handle.error("HTTP error occurred: %s", exc)
+            error = f"HTTP error: {exc.response.status_code}"
+            # Client errors show the API is reachable; only server errors count
+            if exc.response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        elif isinstance(exc, ValueError):
+            logger_handle.error("Value error: %s", exc)
+            error = f"Value error: {exc}"
+        elif isinstance(exc, KeyError):
+            logger_handle.error("Missing expected data in response: %s", exc)
+            error = f"Missing expected data: {exc}"
             status_code = HTTPStatus.BAD_GATEWAY
-        except (TypeError, AttributeError) as exc:
-            logger_handle.error(f"Unexpected type or attribute error: {exc}")
+        else:
+            logger_handle.error("Unexpected type or attribute error: %s", exc)
             error = f"Unexpected error: {exc!s}"
-
-        if error:
-            return self._handle_error(error, status_code)
-
-        return data
+        return error, status_code
 
     def _handle_error(self, message, status_code):
-        """Handles API errors and returns a Flask response.
+        """Handles API errors and returns an error payload.
+
+        The payload is a plain ``({"error": message}, status_code)`` tuple rather
+        than a Flask response, so programmatic callers can inspect it without an
+        application context. Flask serialises the tuple if a view returns it.
 
         Args:
             message (str): The error message to log and return.
             status_code (int): The HTTP status code for the error response.
 
         Returns:
-            Response: A Flask redirect or JSON error response.
+            Response | tuple[dict[str, str], int]: A Flask redirect, or the error
+            payload and status code.
         """
         self.logger_handle.error(message)
         if self.redirect_on_error:
             return redirect(url_for("error_page"))
-        return jsonify({"error": message}), status_code
+        return {"error": message}, status_code
 
 
 MASK_LEN = 4
+MASKED_SUFFIX = "-****" * (MASK_LEN - 1)
 ERROR_LEN = 2
+# Shared read-only default for missing nested objects in API payloads
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
 
 def mask_otp(otp: str) -> str:
@@ -246,12 +526,9 @@ def mask_otp(otp: str) -> str:
     Returns:
         str: The masked OTP string.
     """
-    parts = otp.split("-")
-    return (
-        "-".join([parts[0], "****", "****", "****"])
-        if len(parts) == MASK_LEN
-        else "***"
-    )
+    if otp.count("-") != MASK_LEN - 1:
+        return "***"
+    return otp[: otp.find("-")] + MASKED_SUFFIX
 
 
 class OTPVerificationService:  # pylint: disable=too-few-public-methods
@@ -263,11 +540,13 @@ class OTPVerificationService:  # pylint: disable=too-few-public-methods
         """
         self._api = api_client
         self._base = base_path.rstrip("/")
+        self._verify_endpoint = f"{self._base}/verify"
+        self._delete_endpoint = f"{self._base}/delete"
 
     def verify(self, id_str: str, otp: str) -> OtpVerifyResponse:
         """Verifies an OTP for a given ID using the verification API.
 
-        Builds a typed request and sends it to the verification API endpoint. Logs the
+        Builds the request body and sends it to the verification API endpoint. Logs the
         masked OTP for audit purposes. Handles API errors and response validation.
 
         Args:
@@ -280,28 +559,31 @@ class OTPVerificationService:  # pylint: disable=too-few-public-methods
         Raises:
             RuntimeError: If the API returns an error or the response cannot be validated.
         """
-        # Build typed request (StrictStr → keep id_str as a string)
-        req = OtpVerifyRequest(id=id_str, otp=otp)
-
-        # POST using your API client; endpoint path as per your FastAPI route
-        endpoint = f"{self._base}/verify"
-        body: dict[str, Any] = req.model_dump(by_alias=True)
+        # The payload is trivial, so build it directly. The typed request
+        # (StrictStr → keep id_str as a string) still checks the schema unless
+        # Python runs with -O.
+        body: dict[str, Any] = {"id": id_str, "otp": otp}
+        if __debug__:
+            OtpVerifyRequest(id=id_str, otp=otp)
 
         # Do NOT log raw OTPs
-        self._api.logger_handle.debug(
-            f"Calling OTP verify id={id_str} otp={mask_otp(otp)}"
-        )
+        if self._api.logger_handle.isEnabledFor(logging.DEBUG):
+            self._api.logger_handle.debug(
+                "Calling OTP verify id=%s otp=%s", id_str, mask_otp(otp)
+            )
 
-        raw = self._api.post(endpoint=endpoint, body=body, return_json=True)
+        # POST using your API client; endpoint path as per your FastAPI route
+        raw = self._api.post(
+            endpoint=self._verify_endpoint, body=body, return_json=True
+        )
 
-        # If the APIClient returns Flask Response on error, handle that here
+        # On error the APIClient returns an ({"error": message}, status_code) tuple
         if (
             isinstance(raw, tuple)
             and len(raw) == ERROR_LEN
             and isinstance(raw[0], dict)
         ):
-            # e.g., {"error": "..."} , status_code
-            # normalise/raise as needed; here we raise to surface to CLI
+            # Raise so callers can surface the API's error message
             # ADD ERROR HANDLING
             raise RuntimeError(f"OTP verify failed: {raw[0].get('error')}")
 
@@ -315,7 +597,7 @@ class OTPVerificationService:  # pylint: disable=too-few-public-methods
     def delete(self, id_str: str) -> OtpDeleteResponse:
         """Delete an OTP for a given ID using the verification API.
 
-        Builds a typed request and sends it to the verification API endpoint. Logs the
+        Builds the request body and sends it to the verification API endpoint. Logs the
         ID for audit purposes. Handles API errors and response validation.
 
         Args:
@@ -327,26 +609,26 @@ class OTPVerificationService:  # pylint: disable=too-few-public-methods
         Raises:
             RuntimeError: If the API returns an error or the response cannot be validated.
         """
-        # Build typed request (StrictStr → keep id_str as a string)
-        req = OtpDeleteRequest(id=id_str)
-
-        # POST using your API client; endpoint path as per your FastAPI route
-        endpoint = f"{self._base}/delete"
-        body: dict[str, Any] = req.model_dump(by_alias=True)
+        # Build the payload directly; the typed request checks it unless run with -O
+        body: dict[str, Any] = {"id": id_str}
+        if __debug__:
+            OtpDeleteRequest(id=id_str)
 
         # Do NOT log raw OTPs
-        self._api.logger_handle.debug(f"Calling OTP delete id={id_str}")
+        self._api.logger_handle.debug("Calling OTP delete id=%s", id_str)
 
-        raw = self._api.post(endpoint=endpoint, body=body, return_json=True)
+        # POST using your API client; endpoint path as per your FastAPI route
+        raw = self._api.post(
+            endpoint=self._delete_endpoint, body=body, return_json=True
+        )
 
-        # If the APIClient returns Flask Response on error, handle that here
+        # On error the APIClient returns an ({"error": message}, status_code) tuple
         if (
             isinstance(raw, tuple)
             and len(raw) == ERROR_LEN
             and isinstance(raw[0], dict)
         ):
-            # e.g., {"error": "..."} , status_code
-            # normalise/raise as needed; here we raise to surface to CLI
+            # Raise so callers can surface the API's error message
             # ADD ERROR HANDLING
             raise RuntimeError(f"OTP delete failed: {raw[0].get('error')}")
 
@@ -373,39 +655,44 @@ def map_to_lookup_response(
     Returns:
         A populated LookupResponse object.
     """
-    found = data.get("code") is not None
-
     code = data.get("code")
+    found = code is not None
     code_division = data.get("code_division")
 
-    codes = data.get("potential_matches", {}).get("codes") or []
-    codes_count = data.get("potential_matches", {}).get("codes_count") or 0
-    divisions = data.get("potential_matches", {}).get("divisions") or []
-    divisions_count = data.get("potential_matches", {}).get("divisions_count") or 0
+    matches = data.get("potential_matches") or EMPTY_MAPPING
+    codes = matches.get("codes") or ()
+    divisions = matches.get("divisions") or ()
 
-    # Apply limits
-    if max_codes is not None and codes_count > max_codes:
+    # Apply limits to the lists themselves rather than the reported counts, so
+    # the models built below stay bounded even if the counts are missing
+    if max_codes is not None and len(codes) > max_codes:
         logger.info(
-            f"Limit potential sic-lookup codes to {max_codes}, received {codes_count}"
+            "Limit potential sic-lookup codes to %s, received %s",
+            max_codes,
+            len(codes),
         )
         codes = codes[:max_codes]
 
-    if max_divisions is not None and divisions_count > max_divisions:
+    if max_divisions is not None and len(divisions) > max_divisions:
         logger.info(
-            f"Limit potential sic-lookup divisions to {max_divisions}, received {divisions_count}"
+            "Limit potential sic-lookup divisions to %s, received %s",
+            max_divisions,
+            len(divisions),
         )
         divisions = divisions[:max_divisions]
 
     potential_codes = [PotentialCode(code=code, description="") for code in codes]
 
-    potential_divisions = [
-        PotentialDivision(
-            code=div.get("code", ""),
-            title=div.get("meta", {}).get("title", ""),
-            detail=div.get("meta", {}).get("detail", None),
+    potential_divisions = []
+    for div in divisions:
+        meta = div.get("meta") or EMPTY_MAPPING
+        potential_divisions.append(
+            PotentialDivision(
+                code=div.get("code", ""),
+                title=meta.get("title", ""),
+                detail=meta.get("detail"),
+            )
         )
-        for div in divisions
-    ]
 
     return LookupResponse(
         found=found,
@@ -417,20 +704,28 @@ def map_to_lookup_response(
     )
 
 
+# Shared transport and credentials for identity token requests, reused across calls
+_AUTH_REQUEST = Request()
+_CREDS_LOCK = threading.Lock()
+
+
 def get_verification_api_id_token(audience: str) -> str:
     """Generates a Google identity token for the Firestore OTP API.
 
-    This function uses the Google Cloud CLI (`gcloud`) to generate an identity token
-    for authenticating requests to the Firestore OTP API. The command is executed
-    using a subprocess call with hardcoded arguments, ensuring no untrusted input
-    is passed to the shell.
+    The token is minted in-process with google-auth. A token supplied via the
+    UI_SA_ID_TOKEN environment variable takes precedence. Otherwise the token is
+    fetched for the audience from the metadata server or a service account, falling
+    back to refreshing local user credentials for development.
+
+    Args:
+        audience (str): The audience (target URL) the token is issued for.
 
     Returns:
         str: The generated Google identity token.
 
     Raises:
-        RuntimeError: If the `gcloud` CLI is not found in the system PATH.
-        subprocess.CalledProcessError: If the subprocess call fails.
+        google.auth.exceptions.DefaultCredentialsError: If no credentials are found.
+        google.auth.exceptions.RefreshError: If the credentials cannot be refreshed.
     """
     # First check if a UI SA token has been supplied via UI_SA_ID_TOKEN (e.g. Cloud Build CICD)
     ui_sa_id_token = os.getenv("UI_SA_ID_TOKEN")
@@ -438,18 +733,31 @@ def get_verification_api_id_token(audience: str) -> str:
         logger.info("Returning UI SA ID Token from UI_SA_ID_TOKEN env var")
         return ui_sa_id_token
 
-    logger.info(f"Aud:{audience}")
-    req = Request()
+    logger.info("Aud:%s", audience)
     try:
         # Works in Cloud Run (metadata) and locally if ADC is a service account.
-        return oauth_id_token.fetch_id_token(req, audience)
+        return oauth_id_token.fetch_id_token(_AUTH_REQUEST, audience)
     except DefaultCredentialsError:
 
         # Likely local user ADC; fallback for local dev
-        creds, _project_id = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        auth_req = Request()
-        creds.refresh(auth_req)
-        id_token = creds.id_token
-        return id_token
+        # The credentials do not track the ID token expiry, so refresh every call
+        creds = _get_default_credentials()
+        with _CREDS_LOCK:
+            creds.refresh(_AUTH_REQUEST)
+            return creds.id_token
+
+
+@functools.cache
+def _get_default_credentials() -> Any:
+    """Returns the application default credentials, discovering them once.
+
+    Credential discovery reads environment variables and files on disk, so the
+    result is cached for the lifetime of the process.
+
+    Returns:
+        Any: The cached Google credentials object.
+    """
+    creds, _project_id = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+    )
+    return creds
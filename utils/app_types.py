@@ -4,16 +4,52 @@ This module provides type aliases and a custom Flask app class with additional a
 for use in the Survey Assist UI application.
 """
 
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from typing import Any, Union
 
 from flask import Flask
 from flask import Response as FlaskResponse
 from werkzeug.wrappers import Response as WerkzeugResponse
 
+from utils.cache_utils import ResponseCache
+
 # Type alias for the response type used in the application
 ResponseType = Union[FlaskResponse, WerkzeugResponse]
 
 
+@dataclass(frozen=True, slots=True)
+class SurveyAssistConfig:
+    """Survey Assist settings derived once from the survey definition.
+
+    Attributes:
+        interaction_after_question_id (str | None): The question the first
+            interaction follows, or None if there are no interactions.
+        interaction_param (str | None): The classification the first interaction
+            performs (e.g. "sic").
+    """
+
+    interaction_after_question_id: str | None = None
+    interaction_param: str | None = None
+
+    @classmethod
+    def from_mapping(cls, survey_assist: Mapping[str, Any]) -> "SurveyAssistConfig":
+        """Build the config from the survey_assist section of the survey definition.
+
+        Args:
+            survey_assist (Mapping[str, Any]): Survey Assist configuration.
+
+        Returns:
+            SurveyAssistConfig: The derived settings.
+        """
+        interactions = survey_assist.get("interactions") or ()
+        first: Mapping[str, Any] = interactions[0] if interactions else {}
+        return cls(
+            interaction_after_question_id=first.get("after_question_id"),
+            interaction_param=first.get("param"),
+        )
+
+
 class SurveyAssistFlask(Flask):
     """Custom Flask app class with additional attributes for Survey Assist.
 
@@ -22,18 +58,25 @@ class SurveyAssistFlask(Flask):
         api_base (str): The base URL for the Survey Assist API.
         api_ver (str): The version of the Survey Assist API (defaults to v1).
         api_token (str): The Survey Assist API authentication token.
+        sic_lookup_cache (ResponseCache): Successful SIC lookup responses keyed on
+            the normalised organisation description.
         verify_api_client (Any): The Verify client instance for external auth requests.
         verify_api_base (str): The base URL for the Verify API.
         verify_api_token (str): The Verify API authentication token.
+        otp_service (Any): OTP verification service wrapping verify_api_client.
         sa_email (str): Survey Assist service account.
         survey_title (str): Title of the survey.
+        survey_id (str): Survey identifier for results, derived from the title.
         wave_id (str): Wave (run) of the survey.
         survey_intro (bool): Is survey intro enabled or not.
         survey_summary (bool): Is survey summary enabled or not.
         show_consent (bool): Should the consent be shown before Survey Assist questions.
-        survey_assist (dict[str, Any]): Survey Assist configuration dictionary.
+        survey_assist (Mapping[str, Any]): Read-only Survey Assist configuration.
+        survey_assist_config (SurveyAssistConfig): Settings derived from survey_assist.
         token_start_time (int): Start time for the authentication token.
-        questions (list[dict[str, Any]]): List of survey question dictionaries.
+        questions (Sequence[Mapping[str, Any]]): Read-only survey question definitions.
+        question_routing (Mapping[str, tuple[str, bool]]): Question name to response
+            name and whether it is the last question.
         show_feedback (bool): Display feedback questions.
         feedback: (list[dict[str, Any]]): Feedback config and list of feedback questions
     """
@@ -42,17 +85,22 @@ class SurveyAssistFlask(Flask):
     api_base: str
     api_ver: str
     api_token: str
+    sic_lookup_cache: ResponseCache
     verify_api_client: Any
     verify_api_base: str
     verify_api_token: str
+    otp_service: Any
     sa_email: str
     survey_title: str
+    survey_id: str
     wave_id: str
     survey_intro: bool
     survey_summary: bool
     show_consent: bool
-    survey_assist: dict[str, Any]
+    survey_assist: Mapping[str, Any]
+    survey_assist_config: SurveyAssistConfig
     token_start_time: int
-    questions: list[dict[str, Any]]
+    questions: Sequence[Mapping[str, Any]]
+    question_routing: Mapping[str, tuple[str, bool]]
     show_feedback: bool
     feedback: dict[str, Any]
@@ -4,9 +4,143 @@ This module provides helper functions setting up the Flask application.
 """
 
 import json
+import re
+from collections.abc import Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from utils.app_types import SurveyAssistConfig
+
+number_to_word: dict[int, str] = {
+    1: "one",
+    2: "two",
+    3: "three",
+    4: "four",
+    5: "five",
+    6: "six",
+}
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only equivalents.
+
+    Lists become tuples and dictionaries become ``MappingProxyType`` views, so
+    configuration held on the app for the life of a worker cannot be mutated
+    by request handlers.
+
+    Args:
+        value: A value produced by ``json.loads``.
+
+    Returns:
+        Any: The frozen equivalent of ``value``.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert frozen configuration back into dicts and lists.
+
+    Use this before storing configuration values in the session, which can
+    only serialise plain JSON types.
+
+    Args:
+        value: A value produced by ``freeze`` (or an already mutable value).
+
+    Returns:
+        Any: A mutable copy of ``value``.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+def resolve_consent_text(consent: dict[str, Any]) -> str:
+    """Replace the placeholders in the Survey Assist consent question text.
+
+    PLACEHOLDER_FOLLOWUP is replaced with the maximum number of follow-up
+    questions in words and PLACEHOLDER_REASON with the configured reason.
+
+    Args:
+        consent (dict[str, Any]): The Survey Assist consent configuration.
+
+    Returns:
+        str: The consent question text with placeholders resolved.
+    """
+    question_text = consent.get("question_text", "")
+
+    if "PLACEHOLDER_FOLLOWUP" in question_text:
+        max_followup = consent["max_followup"]
+
+        if max_followup == 1:
+            followup_text = "one additional question"
+        else:
+            # convert numeric to string
+            number_word = number_to_word.get(max_followup, "unknown")
+
+            followup_text = f"a maximum of {number_word} additional questions"
+
+        question_text = question_text.replace("PLACEHOLDER_FOLLOWUP", followup_text)
+
+    if "PLACEHOLDER_REASON" in question_text:
+        question_text = question_text.replace(
+            "PLACEHOLDER_REASON", consent["placeholder_reason"]
+        )
+
+    return question_text
+
+
+def validate_placeholder_fields(questions: list[dict[str, Any]]) -> None:
+    """Check each placeholder_field refers to an earlier question's response.
+
+    Responses are stored in session keyed on response_name with hyphens replaced
+    by underscores, so placeholder_field must match that form for a question
+    asked before the one that uses it.
+
+    Args:
+        questions (list[dict[str, Any]]): The survey question definitions.
+
+    Raises:
+        ValueError: If a placeholder_field does not match an earlier response.
+    """
+    earlier_responses: set[str] = set()
+    for question in questions:
+        placeholder_field = question.get("placeholder_field")
+        if placeholder_field and placeholder_field not in earlier_responses:
+            raise ValueError(
+                f"Question '{question.get('question_name')}' placeholder_field "
+                f"'{placeholder_field}' does not match an earlier response"
+            )
+        earlier_responses.add(question.get("response_name", "").replace("-", "_"))
+
+
+def build_question_routing(
+    questions: Sequence[Mapping[str, Any]],
+) -> MappingProxyType[str, tuple[str, bool]]:
+    """Index the survey questions by name for response routing.
+
+    Args:
+        questions (Sequence[Mapping[str, Any]]): The survey question definitions.
+
+    Returns:
+        MappingProxyType[str, tuple[str, bool]]: Maps each question_name to its
+        response_name and whether it is the last question in the survey. If a
+        name is repeated the first question with that name is used.
+    """
+    last_index = len(questions) - 1
+    routing: dict[str, tuple[str, bool]] = {}
+    for i, question in enumerate(questions):
+        routing.setdefault(
+            question["question_name"], (question["response_name"], i == last_index)
+        )
+    return MappingProxyType(routing)
+
 
 def load_survey_definition(flask_app: Any, file_path: str | Path) -> None:
     """Load survey definition from JSON and set attributes on the Flask app.
@@ -17,7 +151,8 @@ def load_survey_definition(flask_app: Any, file_path: str | Path) -> None:
 
     Raises:
         FileNotFoundError - if the JSON file cannot be found.
-        ValueError - if the file contains invalid JSON.
+        ValueError - if the file contains invalid JSON or a question placeholder
+            refers to an unknown response.
     """
     file_path = Path(file_path)
 
@@ -26,8 +161,7 @@ def load_survey_definition(flask_app: Any, file_path: str | Path) -> None:
 
     # Load the survey definition
     try:
-        with file_path.open(encoding="utf-8") as file:
-            survey_definition = json.load(file)
+        survey_definition = json.loads(file_path.read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {file_path}") from e
 
@@ -35,6 +169,9 @@ def load_survey_definition(flask_app: Any, file_path: str | Path) -> None:
         "survey_title", "Survey Assist Example"
     )
 
+    # Identifier used for the survey in results, derived from the title
+    flask_app.survey_id = re.sub(r"\s+", "_", flask_app.survey_title.strip().lower())
+
     flask_app.wave_id = survey_definition.get("wave_id", "DD-MM-YYYY-XXD")
 
     survey_intro = survey_definition.get("survey_intro", {})
@@ -49,11 +186,23 @@ def load_survey_definition(flask_app: Any, file_path: str | Path) -> None:
     else:
         flask_app.survey_summary = False
 
-    flask_app.questions = survey_definition["questions"]
-    flask_app.survey_assist = survey_definition["survey_assist"]
+    validate_placeholder_fields(survey_definition["questions"])
 
-    sa_consent = flask_app.survey_assist.get("consent", {})
+    # The consent text only depends on config, so resolve it once here
+    sa_consent = survey_definition["survey_assist"].get("consent")
     if isinstance(sa_consent, dict):
+        sa_consent["question_text"] = resolve_consent_text(sa_consent)
+
+    # The question and Survey Assist config are read-only for the life of the app
+    flask_app.questions = freeze(survey_definition["questions"])
+    flask_app.survey_assist = freeze(survey_definition["survey_assist"])
+    flask_app.survey_assist_config = SurveyAssistConfig.from_mapping(
+        flask_app.survey_assist
+    )
+    flask_app.question_routing = build_question_routing(survey_definition["questions"])
+
+    sa_consent = flask_app.survey_assist.get("consent", {})
+    if isinstance(sa_consent, Mapping):
         flask_app.show_consent = sa_consent.get("required", False)
     else:
         flask_app.show_consent = False
@@ -0,0 +1,77 @@
+"""Caching utilities for Survey Assist UI.
+
+This module provides a small in-process cache used to avoid repeating identical
+requests to the Survey Assist API.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class ResponseCache:
+    """Bounded, thread-safe least-recently-used cache for API responses.
+
+    Used to avoid repeating identical requests to the Survey Assist API when
+    the response depends only on the request inputs (e.g. SIC lookup). Entries
+    can optionally expire after a fixed time to live.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        """Initialises an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept before the least
+                recently used entry is evicted.
+            ttl (float | None): Seconds an entry stays valid after it is stored,
+                or None to keep entries until they are evicted.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value for a key, or None if missing or expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of cached entries, including any not yet purged."""
+        return len(self._data)
@@ -52,21 +52,15 @@ class FeedbackQuestion(TypedDict, total=False):
     response_options: list[str]  # only present for radio questions
 
 
-def _selected_ids_selector(
-    questions: list[dict[str, Any]],
+def _requested_ids(
     question_ids: str | Sequence[str] | None,
-) -> set[str]:
-    """Resolve which question_ids to include, validating explicit ids."""
-    all_ids = {q.get("question_id", "") for q in questions}
+) -> frozenset[str] | None:
+    """Normalise requested question_ids, returning None to select every question."""
     if not question_ids:
-        return all_ids
-
-    wanted = {question_ids} if isinstance(question_ids, str) else set(question_ids)
-
-    missing = wanted - all_ids
-    if missing:
-        raise ValueError(f"question_id(s) not found: {sorted(missing)}")
-    return wanted
+        return None
+    if isinstance(question_ids, str):
+        return frozenset((question_ids,))
+    return frozenset(question_ids)
 
 
 def get_list_of_option_text(opts: list) -> list:
@@ -79,16 +73,61 @@ def get_list_of_option_text(opts: list) -> list:
     Returns:
         list: List of non-empty label text strings found in the options.
     """
-    texts: list[str] = []
-    for opt in opts:
-        if not isinstance(opt, dict):
+    labels = (opt.get("label") for opt in opts if isinstance(opt, dict))
+    return [
+        text
+        for label in labels
+        if isinstance(label, dict)
+        and isinstance(text := label.get("text"), str)
+        and text.strip()
+    ]
+
+
+def _select_feedback_questions(
+    questions: list[dict[str, Any]], requested_ids: frozenset[str] | None
+) -> list[FeedbackQuestion]:
+    """Copy the requested survey questions into feedback questions.
+
+    Args:
+        questions: Survey questions to select from.
+        requested_ids: Question ids to copy, or None to copy every question.
+
+    Returns:
+        The copied questions, in survey order.
+
+    Raises:
+        ValueError: If a requested question_id is not in the survey.
+    """
+    # Select, copy and track found ids in a single pass over the questions
+    copied: list[FeedbackQuestion] = []
+    found: set[str] = set()
+    for q in questions:
+        qid = q.get("question_id")
+        if qid is None:
             continue
-        label = opt.get("label")
-        if isinstance(label, dict):
-            text = label.get("text")
-            if isinstance(text, str) and text.strip():
-                texts.append(text)
-    return texts
+        if requested_ids is not None:
+            if qid not in requested_ids:
+                continue
+            found.add(qid)
+
+        fq: FeedbackQuestion = {
+            "response": q.get("response"),
+            "response_name": q.get("response_name", ""),
+        }
+
+        if q.get("response_type") == "radio":
+            opts = q.get("response_options") or []
+            texts = get_list_of_option_text(opts)
+            fq["response_options"] = texts
+
+        copied.append(fq)
+
+    if requested_ids is not None:
+        missing = requested_ids - found
+        if missing:
+            raise ValueError(f"question_id(s) not found: {sorted(missing)}")
+
+    return copied
 
 
 def copy_feedback_from_survey_iteration(  # pylint: disable=too-many-locals
@@ -104,6 +143,7 @@ def copy_feedback_from_survey_iteration(  # pylint: disable=too-many-locals
     - Copies: response_name, response
     - If response_type == 'radio', also copies response_options as a list of label texts
       (e.g., ['Yes', 'No']). For non-radio, response_options is omitted.
+    - Questions without a question_id are not copied.
 
     Args:
         session_data: Flask session-like mapping.
@@ -120,25 +160,7 @@ def copy_feedback_from_survey_iteration(  # pylint: disable=too-many-locals
     if not isinstance(questions, list):
         raise TypeError(f"{src_key}['questions'] must be a list")
 
-    wanted = _selected_ids_selector(questions, question_ids)
-
-    copied: list[FeedbackQuestion] = []
-    for q in questions:
-        qid = q.get("question_id")
-        if qid not in wanted:
-            continue
-
-        fq: FeedbackQuestion = {
-            "response": q.get("response"),
-            "response_name": q.get("response_name", ""),
-        }
-
-        if q.get("response_type") == "radio":
-            opts = q.get("response_options") or []
-            texts = get_list_of_option_text(opts)
-            fq["response_options"] = texts
-
-        copied.append(fq)
+    copied = _select_feedback_questions(questions, _requested_ids(question_ids))
 
     dest = session_data.get(dest_key)
     if not isinstance(dest, dict) or not isinstance(dest.get("questions"), list):
@@ -11,6 +11,7 @@ Typical usage example:
 """
 
 import re
+from typing import ClassVar
 
 from survey_assist_utils.logging import get_logger
 
@@ -18,6 +19,31 @@ logger = get_logger(__name__, level="INFO")
 
 MIN_WORD_LEN = 3
 
+# Shared patterns are compiled once at import as the filters run on every answer
+DANGEROUS_PATTERNS = (
+    r"ignore\s+(all\s+)?previous\s+instructions?",
+    r"you\s+are\s+now\s+(in\s+)?developer\s+mode",
+    r"system\s+override",
+    r"reveal\s+prompt",
+    r"override\s+instructions",
+)
+DANGEROUS_REGEXES = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in DANGEROUS_PATTERNS
+)
+# One alternation finds any dangerous pattern in a single scan
+DANGEROUS_UNION = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in DANGEROUS_PATTERNS), re.IGNORECASE
+)
+WORD_PATTERN = re.compile(r"\b\w+\b")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+REPEAT_PATTERN = re.compile(r"(.)\1{3,}")
+LETTER_PATTERN = re.compile(r"[A-Za-z]")
+
+
+def _middle_signature(word: str) -> str:
+    """Return the middle letters of a word in sorted order."""
+    return "".join(sorted(word[1:-1]))
+
 
 class PromptInjectionFilter:
     """Detect and sanitize potential prompt injection attempts in user input.
@@ -27,13 +53,7 @@ class PromptInjectionFilter:
     """
 
     def __init__(self):
-        self.dangerous_patterns = [
-            r"ignore\s+(all\s+)?previous\s+instructions?",
-            r"you\s+are\s+now\s+(in\s+)?developer\s+mode",
-            r"system\s+override",
-            r"reveal\s+prompt",
-            r"override\s+instructions",
-        ]
+        self.dangerous_patterns = DANGEROUS_PATTERNS
 
         # Fuzzy matching for typoglycemia attacks
         self.fuzzy_patterns = [
@@ -44,40 +64,42 @@ class PromptInjectionFilter:
             "delete",
             "system",
         ]
+        # Sorted middle letters of each fuzzy target, indexed by length and end
+        # letters, so an input word is only sorted when a target could match
+        self._fuzzy_index: dict[tuple[int, str, str], list[tuple[str, str]]] = {}
+        for target in self.fuzzy_patterns:
+            if len(target) >= MIN_WORD_LEN:
+                self._fuzzy_index.setdefault(
+                    (len(target), target[0], target[-1]), []
+                ).append((target, _middle_signature(target)))
 
     def detect_injection(self, text: str | None) -> tuple[bool, str | None]:
         """Return (is_injection_detected, reason)."""
         text = "" if text is None else text
 
-        # Standard pattern matching
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                reason = f"Matched dangerous regex pattern: {pattern}"
-                return True, reason
+        # Standard pattern matching, naming the first listed pattern that matched
+        if DANGEROUS_UNION.search(text):
+            for pattern, regex in zip(
+                DANGEROUS_PATTERNS, DANGEROUS_REGEXES, strict=True
+            ):
+                if regex.search(text):
+                    reason = f"Matched dangerous regex pattern: {pattern}"
+                    return True, reason
 
         # Fuzzy matching
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = WORD_PATTERN.findall(text.lower())
         for word in words:
-            for pattern in self.fuzzy_patterns:
-                if self._is_similar_word(word, pattern):
+            candidates = self._fuzzy_index.get((len(word), word[0], word[-1]))
+            if not candidates:
+                continue
+            signature = _middle_signature(word)
+            for pattern, pattern_signature in candidates:
+                if signature == pattern_signature:
                     reason = f"Fuzzy match: input word '{word}' similar to '{pattern}'"
                     return True, reason
 
         return False, None
 
-    def _is_similar_word(self, word: str | None, target: str) -> bool:
-        """Check if word is a typoglycemia variant of target."""
-        if word is None:
-            return False
-
-        if len(word) != len(target) or len(word) < MIN_WORD_LEN:
-            return False
-        return (
-            word[0] == target[0]
-            and word[-1] == target[-1]
-            and sorted(word[1:-1]) == sorted(target[1:-1])
-        )
-
     def sanitize_input(self, text: str | None, *, max_len: int = 500) -> str:
         """Sanitize user input by removing dangerous patterns
         and normalizing whitespace.
@@ -86,20 +108,15 @@ class PromptInjectionFilter:
             return ""
 
         # 1) Normalize
-        text = re.sub(r"\s+", " ", text)  # collapse whitespace
-        text = re.sub(r"(.)\1{3,}", r"\1", text)  # squash excessive repeats
+        text = WHITESPACE_PATTERN.sub(" ", text)  # collapse whitespace
+        text = REPEAT_PATTERN.sub(r"\1", text)  # squash excessive repeats
 
         # Find earliest dangerous regex match
-        earliest = None
-        for pat in self.dangerous_patterns:
-            m = re.search(pat, text, flags=re.IGNORECASE)
-            if m:
-                start = m.start()
-                earliest = start if earliest is None else min(earliest, start)
+        m = DANGEROUS_UNION.search(text)
 
         # Cut everything from the first trigger onward
-        if earliest is not None:
-            text = text[:earliest].rstrip()
+        if m:
+            text = text[: m.start()].rstrip()
             # Add FILTERED to the cut
             text += " FILTERED CONTENT REMOVED"
 
@@ -124,23 +141,29 @@ class SafeInputFilter(PromptInjectionFilter):
         }
     )
 
+    # Smart quotes are replaced and control/invisible characters (C0, DEL, C1,
+    # zero-width spaces and BOM) deleted in a single translate pass
+    SANITIZE_MAP: ClassVar[dict[int, str | None]] = {
+        **SMART_QUOTE_MAP,
+        **dict.fromkeys(
+            [*range(0x00, 0x20), *range(0x7F, 0xA0), *range(0x200B, 0x200E), 0xFEFF]
+        ),
+    }
+
     # ruff: enable: RUF001
     def sanitize_input(self, text: str | None, *, max_len: int = 500) -> str:
         if text is None:
             return ""
         original_text = text
         # Normalize spaces and repetition
-        text = re.sub(r"\s+", " ", text)
-        text = re.sub(r"(.)\1{3,}", r"\1", text)
-
-        # Replace smart quotes with standard quotes
-        text = text.translate(self.SMART_QUOTE_MAP)
+        text = WHITESPACE_PATTERN.sub(" ", text)
+        text = REPEAT_PATTERN.sub(r"\1", text)
 
-        # Remove control/invisible characters
-        text = re.sub(r"[\x00-\x1F\x7F-\x9F\u200B-\u200D\uFEFF]", "", text)
+        # Replace smart quotes and remove control/invisible characters
+        text = text.translate(self.SANITIZE_MAP)
 
         # Remove unsafe special characters
-        text = re.sub(self.SAFE_CHARS_PATTERN, "", text)
+        text = self.SAFE_CHARS_PATTERN.sub("", text)
 
         # Log any changes made
         if text != original_text:
@@ -164,7 +187,7 @@ def replace_if_no_letters(person_id, text):
         str: The original text if it contains letters, otherwise 'NO LEGIBLE ANSWER'.
     """
     # Check if there's at least one alphabetic character
-    if not re.search(r"[A-Za-z]", str(text)):
+    if not LETTER_PATTERN.search(str(text)):
         logger.info(
             f"person_id:{person_id} Input replaced with 'NO LEGIBLE ANSWER' due to lack of letters."
         )
@@ -3,10 +3,10 @@
 This module provides helper functions for debugging and inspecting the Flask session object.
 """
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union, cast
 
 from flask import current_app, request, session
 from flask.sessions import SecureCookieSessionInterface
@@ -24,6 +24,8 @@ from models.result import (
 )
 from utils.access_utils import delete_access
 from utils.api_utils import map_to_lookup_response
+from utils.app_types import SurveyAssistFlask
+from utils.app_utils import thaw
 from utils.input_utils import PromptInjectionFilter, SafeInputFilter
 
 T = TypeVar("T", bound=BaseModel)
@@ -81,8 +83,9 @@ def log_route(participant_override: str | None = None):
 
 def session_debug(f: Callable) -> Callable:
     """Decorator to print session information after a view function is executed.
-    This decorator checks if the application's config has SESSION_DEBUG set to True,
-    and if so, it prints the session's contents and its size in bytes to the console.
+    When the app's SESSION_DEBUG config is set, the session's contents and its size
+    in bytes are printed after each request. The config is checked on each request,
+    so it can be set in create_app or through test_config.
 
     Args:
         f (function): The view function to be decorated.
@@ -94,7 +97,8 @@ def session_debug(f: Callable) -> Callable:
     @wraps(f)
     def decorated_function(*args, **kwargs):
         response = f(*args, **kwargs)
-        print_session_info()
+        if current_app.config.get("SESSION_DEBUG", False):
+            print_session_info()
         return response
 
     return decorated_function
@@ -170,12 +174,12 @@ def print_session_info() -> None:
 
 
 def add_question_to_survey(
-    question: dict[str, Any], user_response: Optional[str]
+    question: Mapping[str, Any], user_response: Optional[str]
 ) -> None:
     """Append a new question and user response to the session survey iteration.
 
     Args:
-        question (dict[str, Any]): A dictionary representing the question metadata,
+        question (Mapping[str, Any]): A mapping representing the question metadata,
             containing keys like "question_id", "question_text", etc.
         user_response (Optional[str]): The response value submitted by the user.
 
@@ -225,10 +229,12 @@ def add_question_to_survey(
             "question_id": question["question_id"],
             "question_text": question["question_text"],
             "response_type": question["response_type"],
-            "response_options": question.get("response_options", []),
+            "response_options": thaw(question.get("response_options", [])),
             "response_name": question["response_name"],
             "response": clean_user_response,
-            "used_for_classifications": question.get("used_for_classifications", []),
+            "used_for_classifications": thaw(
+                question.get("used_for_classifications", [])
+            ),
         }
     )
 
@@ -317,6 +323,37 @@ def save_model_to_session(key: str, model: BaseModel) -> None:
     session[key] = model.model_dump(mode="json")
 
 
+def init_survey_result(now: datetime) -> None:
+    """Initialise the survey result model in the session for a new survey.
+
+    The case_id identifies the household that received the survey, user is the
+    main user that starts the survey and person_id is an individual respondent
+    in the household. End times are set to the start time and updated later.
+
+    Args:
+        now (datetime): The time the survey was started.
+    """
+    app = cast(SurveyAssistFlask, current_app)
+    person_id = get_person_id()
+    result_model = GenericSurveyAssistResult(
+        survey_id=app.survey_id,
+        wave_id=app.wave_id,
+        case_id=session["participant_id"],
+        user=person_id,
+        time_start=now,
+        time_end=now,
+        responses=[
+            GenericResponse(
+                person_id=person_id,
+                time_start=now,
+                time_end=now,
+                survey_assist_interactions=[],
+            )
+        ],
+    )
+    save_model_to_session("survey_result", result_model)
+
+
 def load_model_from_session(key: str, model_class: type[T]) -> T:
     """Loads and reconstructs a Pydantic model from Flask session."""
     return model_class.model_validate(session[key])
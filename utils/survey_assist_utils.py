@@ -6,6 +6,7 @@ questions, and performing SIC code lookups.
 
 from datetime import datetime, timezone
 from typing import cast
+from urllib.parse import urlencode
 
 from flask import current_app, redirect, render_template, session, url_for
 from pydantic import ValidationError
@@ -235,39 +236,25 @@ def perform_sic_lookup(org_description: str) -> tuple[dict, datetime, datetime]:
 
     # Check org desc has alphabetic characters
     org_description = replace_if_no_letters(get_person_id(), org_description)
-    api_url = f"/survey-assist/sic-lookup?description={org_description}&similarity=true"
-    logger.info(
-        f"person_id:{get_person_id()} send /sic-lookup request"  # pylint: disable=line-too-long
-    )
-    response = api_client.get(endpoint=api_url)
+
+    # The lookup depends only on the query sent, so an identical query
+    # reuses an earlier successful response.
+    query = urlencode({"description": org_description, "similarity": "true"})
+    api_url = f"/survey-assist/sic-lookup?{query}"
+    response = app.sic_lookup_cache.get(api_url)
+    if response is not None:
+        logger.info("person_id:%s /sic-lookup served from cache", get_person_id())
+    else:
+        logger.info("person_id:%s send /sic-lookup request", get_person_id())
+        response = api_client.get(endpoint=api_url)
+        # Errors are returned as (body, status) tuples and must not be cached
+        if isinstance(response, dict):
+            app.sic_lookup_cache.set(api_url, response)
     end_time = datetime.now(timezone.utc)
     session.modified = True
     return response, start_time, end_time
 
 
-def classify_and_redirect(job_title: str, job_description: str, org_description: str):
-    """Classifies the user's job and organisation details and redirects to the question template.
-
-    Args:
-        job_title (str): The job title to classify.
-        job_description (str): The job description to classify.
-        org_description (str): The organisation description to classify.
-
-    Returns:
-        Response: Redirect to the question template page.
-    """
-    classification = classify(
-        classification_type="sic",
-        job_title=job_title,
-        job_description=job_description,
-        org_description=org_description,
-    )
-    logger.debug("Classification response")
-    logger.debug(f"{classification}")
-
-    return redirect(url_for("survey.question_template"))
-
-
 def classify_and_handle_followup(
     job_title: str, job_description: str, org_description: str
 ):
@@ -356,7 +343,6 @@ def classify_and_handle_followup(
     )
 
     # Add to survey iteration
-    # survey_iteration = session.get("survey_iteration", {})
     question_dict = formatted_question.to_dict()
     add_question_to_survey(
         question=question_dict,
@@ -2,11 +2,9 @@
 
 This module provides functions to update survey session data, determine question routing,
 and handle redirects for consent and follow-up questions in a Flask-based survey application.
-
-Globals:
-    number_to_word (dict): Maps integers 1-6 to their corresponding English words.
 """
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from typing import Any, cast
 
@@ -23,10 +21,12 @@ from survey_assist_utils.logging import get_logger
 
 from models.result import FollowUpQuestion
 from utils.app_types import ResponseType, SurveyAssistFlask
+from utils.app_utils import build_question_routing, thaw
 from utils.session_utils import (
     add_follow_up_to_latest_classify,
     add_question_to_survey,
     add_sic_lookup_interaction,
+    clean_text,
     get_person_id,
     update_end_time_of_survey_response,
 )
@@ -37,15 +37,6 @@ from utils.survey_assist_utils import (
     perform_sic_lookup,
 )
 
-number_to_word: dict[int, str] = {
-    1: "one",
-    2: "two",
-    3: "three",
-    4: "four",
-    5: "five",
-    6: "six",
-}
-
 logger = get_logger(__name__, level="INFO")
 
 
@@ -68,17 +59,49 @@ def init_survey_iteration() -> dict:
     }
 
 
+def resolve_question_placeholder(question: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Replaces PLACEHOLDER_TEXT in a question with an earlier response.
+
+    Questions that embed an earlier answer name the response key in
+    placeholder_field. The value held in session response is cleaned and
+    substituted into a copy of the question, leaving the survey definition
+    unchanged.
+
+    Args:
+        question (Mapping[str, Any]): The survey question definition.
+
+    Returns:
+        Mapping[str, Any]: The question unchanged if it has no placeholder,
+        otherwise a new dictionary with the question_text resolved.
+    """
+    placeholder_field = question.get("placeholder_field")
+    if not placeholder_field:
+        return question
+
+    replacement_text = clean_text(
+        session.get("response", {}).get(placeholder_field),
+        "placeholder_text",
+        get_person_id(),
+    )
+    return {
+        **question,
+        "question_text": question["question_text"].replace(
+            "PLACEHOLDER_TEXT", replacement_text
+        ),
+    }
+
+
 def find_matching_interaction(
-    current_question: dict[str, Any], interactions: list[dict[str, Any]]
-) -> dict[str, Any] | None:
+    current_question: Mapping[str, Any], interactions: Sequence[Mapping[str, Any]]
+) -> Mapping[str, Any] | None:
     """Finds the first interaction that matches the current question ID.
 
     Args:
-        current_question (dict[str, Any]): The current question being processed.
-        interactions (list[dict[str, Any]]): A list of interaction configuration objects.
+        current_question (Mapping[str, Any]): The current question being processed.
+        interactions (Sequence[Mapping[str, Any]]): Interaction configuration objects.
 
     Returns:
-        dict[str, Any] | None: The matching interaction, or None if no match is found.
+        Mapping[str, Any] | None: The matching interaction, or None if no match is found.
     """
     current_id = current_question.get("question_id")
     for interaction in interactions:
@@ -90,8 +113,8 @@ def find_matching_interaction(
 # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 def update_session_and_redirect(  # noqa: C901, PLR0912, PLR0915
     req: Request,
-    questions: list[dict[str, Any]],
-    survey_assist: dict[str, Any],
+    questions: Sequence[Mapping[str, Any]],
+    survey_assist: Mapping[str, Any],
     value: str,
     route: str,
 ) -> ResponseType:
@@ -129,17 +152,10 @@ def update_session_and_redirect(  # noqa: C901, PLR0912, PLR0915
         survey_iteration["time_start"] = datetime.now(timezone.utc)
         session.modified = True
 
-    # Get the current question and take a copy so
-    # that the original question data is not modified
-    current_question = questions[session["current_question_index"]]
-    current_question = current_question.copy()
-
-    placeholder_field = current_question["placeholder_field"]
-
-    if "response" in session and placeholder_field in session["response"]:
-        current_question["question_text"] = current_question["question_text"].replace(
-            "PLACEHOLDER_TEXT", session["response"][placeholder_field]
-        )
+    # Get the current question with any placeholder text resolved
+    current_question = resolve_question_placeholder(
+        questions[session["current_question_index"]]
+    )
 
     # Add the question and response to the list of questions
     add_question_to_survey(current_question, req.form.get(value))
@@ -159,7 +175,9 @@ def update_session_and_redirect(  # noqa: C901, PLR0912, PLR0915
         # continue with the Survey Assist interaction
         if survey_assist.get("enabled", True):
             session.modified = True
-            interactions: list[dict[str, Any]] = survey_assist.get("interactions", [])
+            interactions: Sequence[Mapping[str, Any]] = survey_assist.get(
+                "interactions", ()
+            )
 
             matching_interaction = find_matching_interaction(
                 current_question, interactions
@@ -265,13 +283,17 @@ def update_session_and_redirect(  # noqa: C901, PLR0912, PLR0915
 # sumarry of the survey responses.
 def get_question_routing(
     question_name: str,
-    questions: list[dict[str, Any]],
+    questions: Sequence[Mapping[str, Any]],
+    question_routing: Mapping[str, tuple[str, bool]] | None = None,
 ) -> tuple[str, str]:
     """Determines the response name and next route for a given question.
 
     Args:
         question_name (str): The name of the current question.
         questions (list): List of question dictionaries for the survey.
+        question_routing (Mapping | None): Optional index of question name to
+            response name and last-question flag, as built at app start-up.
+            When omitted the questions are scanned.
 
     Returns:
         tuple[str, str]: The response name and the next route name.
@@ -279,19 +301,23 @@ def get_question_routing(
     Raises:
         ValueError: If the question name is not found in the questions list.
     """
-    for i, question in enumerate(questions):
-        if question["question_name"] == question_name:
-            response_name = question["response_name"]
-            # If the question is the last in the list, redirect to summary
-            # else redirect to the next question
-            if i == len(questions) - 1:
-                # Update the end time for the survey result
-                update_end_time_of_survey_response()
-                route = "survey.summary"
-            else:
-                route = "survey.survey"
-            return response_name, route
-    raise ValueError(f"Question name '{question_name}' not found in questions.")
+    if question_routing is None:
+        question_routing = build_question_routing(questions)
+
+    try:
+        response_name, is_last = question_routing[question_name]
+    except KeyError as e:
+        raise ValueError(
+            f"Question name '{question_name}' not found in questions."
+        ) from e
+
+    # If the question is the last in the list, redirect to summary
+    # else redirect to the next question
+    if is_last:
+        # Update the end time for the survey result
+        update_end_time_of_survey_response()
+        return response_name, "survey.summary"
+    return response_name, "survey.survey"
 
 
 def consent_redirect() -> ResponseType:
@@ -329,7 +355,7 @@ def consent_redirect() -> ResponseType:
             "question_text": survey_assist["consent"]["question_text"],
             "response_type": survey_assist["consent"]["response_type"],
             "response_name": survey_assist["consent"]["response_name"],
-            "response_options": survey_assist["consent"]["response_options"],
+            "response_options": thaw(survey_assist["consent"]["response_options"]),
             "response": consent_response,
         }
     )
@@ -361,22 +387,21 @@ def followup_redirect() -> ResponseType | str:
         ResponseType | str: Rendered follow-up question page or redirect response.
     """
     app = cast(SurveyAssistFlask, current_app)
-    questions = app.questions
-    survey_assist = app.survey_assist
+    sa_config = app.survey_assist_config
 
-    # Get the current core question and list of interactions
-    current_question = questions[session["current_question_index"]]
-    interactions = survey_assist.get("interactions", [])
+    # Get the current core question
+    current_question = app.questions[session["current_question_index"]]
 
-    # If the current question has an associated interaction and there
-    # are interactions to process
-    if len(interactions) > 0 and current_question.get("question_id") == interactions[
-        0
-    ].get("after_question_id"):
+    # If the current question has an associated interaction
+    if (
+        sa_config.interaction_after_question_id is not None
+        and current_question.get("question_id")
+        == sa_config.interaction_after_question_id
+    ):
         # Check if the session has follow-up questions
         if "follow_up" in session and FOLLOW_UP_TYPE == "both":
             follow_up = session["follow_up"]
-            if len(follow_up) > 0:
+            if follow_up:
                 # Get the next follow-up question
                 follow_up_question = follow_up.pop(0)
 
@@ -390,7 +415,7 @@ def followup_redirect() -> ResponseType | str:
                     )
                 ]
 
-                if interactions[0].get("param") == "sic":
+                if sa_config.interaction_param == "sic":
                     person_id = get_person_id()
                     # SIC interaction
                     add_follow_up_to_latest_classify(
@@ -427,7 +452,7 @@ def followup_redirect() -> ResponseType | str:
                     )
                 else:
                     logger.error(
-                        f"person_id:{get_person_id()} - interaction {interactions[0].get("param")} is yet to be supported"  # pylint: disable=line-too-long
+                        f"person_id:{get_person_id()} - interaction {sa_config.interaction_param} is yet to be supported"  # pylint: disable=line-too-long
                     )
 
         # No more follow up questions, redirect to the next core question
@@ -442,7 +467,7 @@ def followup_redirect() -> ResponseType | str:
 
 
 def check_route_on_response(
-    question: dict[str, Any],
+    question: Mapping[str, Any],
     user_value: str,
     current_route: str,
 ) -> str: